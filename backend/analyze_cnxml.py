@@ -6,61 +6,86 @@ This script analyzes multiple modules to understand the full scope of educationa
 content we need to handle in our parser.
 """
 
-import xml.etree.ElementTree as ET
 from pathlib import Path
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
 import json
+import sys
+from xml.parsers import expat
+
+from cnxml_parser import get_module_ids
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 def analyze_module(module_path):
-    """Analyze a single module to understand its structure"""
+    """
+    Analyze a single module directly from expat's SAX-style callbacks.
+    
+    Only element names and attributes are counted, so no element objects
+    are built at all.
+    """
     try:
-        tree = ET.parse(module_path)
-        root = tree.getroot()
-        
-        # Count all elements
-        element_counts = Counter()
+        tags = []
+        attribute_counts = Counter()
+        section_classes = []
         
-        # Track elements with important attributes
-        elements_with_attrs = defaultdict(set)
+        # expat reports namespaced names as "uri}local"; map each one once to
+        # the interned "{uri}local" form that ElementTree uses
+        qualified_names = {}
         
-        # Track section types
-        section_types = defaultdict(int)
+        def qualify(name):
+            qualified = qualified_names.get(name)
+            if qualified is None:
+                qualified = sys.intern('{' + name if '}' in name else name)
+                qualified_names[name] = qualified
+            return qualified
         
-        def walk_elements(element, path=""):
-            # Count this element
-            element_counts[element.tag] += 1
+        def start_element(name, attrs):
+            tag = qualify(name)
+            tags.append(tag)
             
-            # Track attributes
-            if element.attrib:
-                for attr, value in element.attrib.items():
-                    elements_with_attrs[element.tag].add(f"{attr}={value}")
-            
-            # Special handling for sections
-            if element.tag.endswith('section'):
-                section_class = element.get('class', 'regular')
-                section_types[section_class] += 1
+            if attrs:
+                attribute_counts.update((tag, qualify(attr), value)
+                                        for attr, value in attrs.items())
             
-            # Recurse into children
-            for child in element:
-                walk_elements(child, path + "/" + element.tag.split("}")[-1])
+            if tag.endswith('section'):
+                section_classes.append(attrs.get('class', 'regular'))
         
-        walk_elements(root)
+        parser = expat.ParserCreate(namespace_separator='}')
+        parser.StartElementHandler = start_element
+        with open(module_path, 'rb') as f:
+            parser.ParseFile(f)
         
-        return {
-            'element_counts': dict(element_counts),
-            'elements_with_attrs': dict(elements_with_attrs),
-            'section_types': dict(section_types)
-        }
+        return summarize_module(Counter(tags), attribute_counts, section_classes)
         
     except Exception as e:
         return {'error': str(e)}
 
+def summarize_module(element_counts, attribute_counts, section_classes):
+    """Build a module's analysis result from its raw counts"""
+    # Keep the distinct (attr, value) pairs per element as tuples; they are
+    # only formatted as "attr=value" for the final report
+    elements_with_attrs = defaultdict(set)
+    for tag, attr, value in attribute_counts:
+        elements_with_attrs[tag].add((attr, value))
+    
+    return {
+        'element_counts': dict(element_counts),
+        'elements_with_attrs': dict(elements_with_attrs),
+        'section_types': dict(Counter(section_classes))
+    }
+
 def analyze_multiple_modules(base_path, num_modules=10):
     """Analyze multiple modules to get comprehensive understanding"""
     modules_dir = Path(base_path) / "modules"
     
-    # Get a sample of modules
-    module_dirs = list(modules_dir.glob("m66*"))[:num_modules]
+    # Get a sample of modules from the bundle's module directories
+    module_ids = get_module_ids(base_path)
+    module_dirs = [modules_dir / mid for mid in module_ids if mid.startswith("m66")][:num_modules]
     
     all_elements = Counter()
     all_attributes = defaultdict(set)
@@ -68,34 +93,42 @@ def analyze_multiple_modules(base_path, num_modules=10):
     
     print(f"Analyzing {len(module_dirs)} modules...")
     
-    for i, module_dir in enumerate(module_dirs):
-        module_file = module_dir / "index.cnxml"
-        if module_file.exists():
-            print(f"  {i+1}/{len(module_dirs)}: {module_dir.name}")
-            
-            analysis = analyze_module(module_file)
+    module_files = [module_dir / "index.cnxml" for module_dir in module_dirs]
+    module_files = [module_file for module_file in module_files if module_file.exists()]
+    
+    # Modules are independent, so analyze them across all CPU cores
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(analyze_module, module_files)
+        
+        for i, (module_file, analysis) in enumerate(zip(module_files, results)):
+            print(f"  {i+1}/{len(module_files)}: {module_file.parent.name}")
             
             if 'error' not in analysis:
                 # Aggregate counts
-                for element, count in analysis['element_counts'].items():
-                    all_elements[element] += count
+                all_elements.update(analysis['element_counts'])
                 
                 # Aggregate attributes
                 for element, attrs in analysis['elements_with_attrs'].items():
                     all_attributes[element].update(attrs)
                 
                 # Aggregate section types
-                for section_type, count in analysis['section_types'].items():
-                    all_section_types[section_type] += count
+                all_section_types.update(analysis['section_types'])
     
+    # Lay the per-element results out as parallel columns: names[i] occurred
+    # counts[i] times with the distinct attribute values in attrs[i]
+    names = list(all_elements.keys())
     return {
         'total_modules_analyzed': len(module_dirs),
-        'element_counts': dict(all_elements),
-        'elements_with_attributes': {k: sorted(list(v)) for k, v in all_attributes.items()},
+        'elements': {
+            'names': names,
+            'counts': list(all_elements.values()),
+            'attrs': [sorted(f"{attr}={value}" for attr, value in all_attributes.get(name, ()))
+                      for name in names]
+        },
         'section_types': dict(all_section_types)
     }
 
-def categorize_elements(element_counts):
+def categorize_elements(names, counts):
     """Categorize elements by their educational purpose"""
     categories = {
         'basic_content': [],
@@ -110,7 +143,7 @@ def categorize_elements(element_counts):
     
     # Clean element names (remove namespace)
     clean_elements = {}
-    for element, count in element_counts.items():
+    for element, count in zip(names, counts):
         clean_name = element.split('}')[-1] if '}' in element else element
         clean_elements[clean_name] = count
     
@@ -151,11 +184,12 @@ def main():
     
     print(f"\n=== Analysis Results ===")
     print(f"Modules analyzed: {analysis['total_modules_analyzed']}")
-    print(f"Unique elements found: {len(analysis['element_counts'])}")
-    print(f"Total elements: {sum(analysis['element_counts'].values())}")
+    columns = analysis['elements']
+    print(f"Unique elements found: {len(columns['names'])}")
+    print(f"Total elements: {sum(columns['counts'])}")
     
     # Categorize elements
-    categories = categorize_elements(analysis['element_counts'])
+    categories = categorize_elements(columns['names'], columns['counts'])
     
     print("\n=== Element Categories ===")
     for category, elements in categories.items():
@@ -172,26 +206,34 @@ def main():
     # Show important attributes
     print("\n=== Important Attributes ===")
     important_elements = ['section', 'exercise', 'note', 'list', 'table', 'figure']
+    
+    # Map local element names to their attribute values once, keeping the
+    # first namespace seen for each
+    by_local = {}
+    for full_name, attrs in zip(columns['names'], columns['attrs']):
+        if attrs:
+            by_local.setdefault(full_name.rsplit('}', 1)[-1], attrs)
+    
     for element in important_elements:
         # Clean element name
         clean_element = element.split('}')[-1] if '}' in element else element
-        full_element = None
-        for full_name in analysis['elements_with_attributes']:
-            if full_name.endswith(clean_element):
-                full_element = full_name
-                break
+        attrs = by_local.get(clean_element)
         
-        if full_element and full_element in analysis['elements_with_attributes']:
-            attrs = analysis['elements_with_attributes'][full_element]
-            if attrs:
-                print(f"  {clean_element}:")
-                for attr in sorted(attrs)[:10]:  # Show first 10
-                    print(f"    {attr}")
+        if attrs:
+            print(f"  {clean_element}:")
+            for attr in attrs[:10]:  # Show first 10
+                print(f"    {attr}")
     
     # Save detailed analysis
     output_file = Path("cnxml_analysis.json")
-    with open(output_file, 'w') as f:
-        json.dump(analysis, f, indent=2, default=str)
+    if HAS_ORJSON:
+        # The analysis is plain lists and dicts, so orjson can serialize it in one go
+        output_file.write_bytes(orjson.dumps(analysis, default=str,
+                                             option=orjson.OPT_INDENT_2))
+    else:
+        # Raw UTF-8 like orjson, so the file is the same either way
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(analysis, f, indent=2, default=str, ensure_ascii=False)
     
     print(f"\nDetailed analysis saved to: {output_file}")
 
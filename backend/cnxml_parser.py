@@ -11,24 +11,111 @@ CNXML is an XML format used by OpenStax that contains:
 - Educational metadata and learning objectives
 """
 
+import io
 import os
-import xml.etree.ElementTree as ET
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
-@dataclass
+# Prefer lxml's libxml2-backed parser; fall back to the stdlib implementation,
+# which exposes the same find/findall/get API used throughout this module.
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+# lxml-only parser options: whitespace-only text nodes and comments are dropped
+# and xml:id indexing is disabled, since none of them are used by the parser
+PARSER_OPTIONS = dict(huge_tree=True, remove_blank_text=True,
+                      remove_comments=True, collect_ids=False) if HAS_LXML else {}
+
+# Fully-qualified tags dispatched on while streaming a module
+_CNXML = '{http://cnx.rice.edu/cnxml}'
+_MDML = '{http://cnx.rice.edu/mdml}'
+_TAG_TITLE = _CNXML + 'title'
+_TAG_CONTENT = _CNXML + 'content'
+_TAG_FIGURE = _CNXML + 'figure'
+_TAG_PARA = _CNXML + 'para'
+_TAG_TERM = _CNXML + 'term'
+_TAG_EMPHASIS = _CNXML + 'emphasis'
+_METADATA_FIELDS = {
+    _MDML + 'title': 'title',
+    _MDML + 'content-id': 'content_id',
+    _MDML + 'uuid': 'uuid'
+}
+_DISPATCHED_TAGS = frozenset(_METADATA_FIELDS) | {
+    _TAG_TITLE, _TAG_FIGURE, _TAG_PARA, _TAG_TERM
+}
+
+
+def make_xml_parser():
+    """
+    Create an XML parser tuned for the CNXML files in the bundle.
+
+    Returns None for the stdlib fallback so ET.parse uses its default parser.
+    """
+    if not HAS_LXML:
+        return None
+    return ET.XMLParser(**PARSER_OPTIONS)
+
+
+def _expand_prefixes(path: str, namespaces: Dict[str, str]) -> str:
+    """Spell out the prefixed names in an element path as '{uri}name'"""
+    return re.sub(r'([\w.-]+):(?=[\w*])',
+                  lambda match: '{' + namespaces[match.group(1)] + '}', path)
+
+
+def compile_path(path: str, namespaces: Dict[str, str]):
+    """
+    Compile an element path once for repeated use.
+
+    With lxml this is a precompiled XPath evaluator; the stdlib fallback wraps
+    findall, which gives the same list-of-elements result. Its prefixes are
+    expanded up front, which saves findall resolving them on every call.
+    """
+    if HAS_LXML:
+        return ET.XPath(path, namespaces=namespaces)
+    path = _expand_prefixes(path, namespaces)
+    return lambda element: element.findall(path)
+
+
+def compile_first(name: str, namespaces: Dict[str, str]):
+    """
+    Compile a search for the first descendant element named `name`.
+
+    The returned callable gives the element or None. lxml evaluates this as
+    'descendant::name[1]', which stops at the first match like find() does.
+    """
+    if HAS_LXML:
+        xpath = ET.XPath(f'descendant::{name}[1]', namespaces=namespaces)
+        return lambda element: next(iter(xpath(element)), None)
+    path = _expand_prefixes(f'.//{name}', namespaces)
+    return lambda element: element.find(path)
+
+@dataclass(slots=True, frozen=True)
+class FigureRef:
+    """Represents a figure referenced by a module"""
+    id: str
+    caption: str
+    media_files: List[Dict[str, str]]
+
+@dataclass(slots=True, frozen=True)
 class ModuleContent:
     """Represents a parsed module with all its content"""
     id: str
     title: str
     content: str  # Plain text content
-    figures: List[Dict[str, Any]]
+    figures: List[FigureRef]
     learning_objectives: List[str]
     key_terms: List[str]
     metadata: Dict[str, Any]
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TextbookStructure:
     """Represents the hierarchical structure of the textbook"""
     title: str
@@ -42,12 +129,15 @@ class CNXMLParser:
     that can be easily processed for RAG applications.
     """
     
-    def __init__(self, base_path: str = "../osbooks-biology-bundle"):
+    def __init__(self, base_path: str = "../osbooks-biology-bundle",
+                 max_cached_modules: int = 128):
         """
         Initialize the parser with the path to the textbook bundle.
         
         Args:
             base_path: Path to the osbooks-biology-bundle directory
+            max_cached_modules: How many parsed modules to memoize; the least
+                                recently used are dropped first
         """
         self.base_path = Path(base_path)
         self.modules_path = self.base_path / "modules"
@@ -59,6 +149,37 @@ class CNXMLParser:
             'md': 'http://cnx.rice.edu/mdml',
             'cnx': 'http://cnx.rice.edu/cnxml'
         }
+        
+        # Paths evaluated for every figure, compiled once per parser
+        self._xp_caption = compile_path('.//cnx:caption', self.namespaces)
+        self._xp_media = compile_path('.//cnx:media', self.namespaces)
+        self._xp_image = compile_path('.//cnx:image', self.namespaces)
+        
+        # Paths evaluated for every collection node
+        self._col_content = compile_path('col:content', self.namespaces)
+        self._col_sub = compile_path('col:subcollection', self.namespaces)
+        self._col_mod = compile_path('col:module', self.namespaces)
+        self._md_title = compile_first('md:title', self.namespaces)
+        
+        # Parsed results, reused for repeat requests during this parser's lifetime
+        self._structure_cache: Optional[TextbookStructure] = None
+        self._module_cache: OrderedDict[str, ModuleContent] = OrderedDict()
+        self.max_cached_modules = max_cached_modules
+        self._module_index: Optional[List[str]] = None
+    
+    def get_module_ids(self) -> List[str]:
+        """
+        List the IDs of all module directories in the bundle.
+        
+        The listing is read once per parser and kept in memory; the bundle is
+        source data, so nothing is written into it.
+        
+        Returns:
+            Sorted list of module IDs (e.g., ['m44386', 'm44388', ...])
+        """
+        if self._module_index is None:
+            self._module_index = get_module_ids(self.base_path)
+        return self._module_index
     
     def parse_collection_structure(self) -> TextbookStructure:
         """
@@ -70,28 +191,32 @@ class CNXMLParser:
         Returns:
             TextbookStructure containing the full hierarchy
         """
+        if self._structure_cache is not None:
+            return self._structure_cache
+        
         if not self.collection_path.exists():
             raise FileNotFoundError(f"Collection file not found: {self.collection_path}")
         
-        tree = ET.parse(self.collection_path)
+        tree = ET.parse(str(self.collection_path), make_xml_parser())
         root = tree.getroot()
         
         # Extract the main title
-        title_elem = root.find('.//md:title', self.namespaces)
+        title_elem = self._md_title(root)
         title = title_elem.text if title_elem is not None else "Biology 2e"
         
         chapters = []
         
         # Parse the hierarchical structure
         # Find the main content element and get only direct subcollections (chapters)
-        content_elem = root.find('col:content', self.namespaces)
-        if content_elem is not None:
-            for subcollection in content_elem.findall('col:subcollection', self.namespaces):
+        content_elems = self._col_content(root)
+        if content_elems:
+            for subcollection in self._col_sub(content_elems[0]):
                 chapter = self._parse_subcollection(subcollection)
                 if chapter:
                     chapters.append(chapter)
         
-        return TextbookStructure(title=title, chapters=chapters)
+        self._structure_cache = TextbookStructure(title=title, chapters=chapters)
+        return self._structure_cache
     
     def _parse_subcollection(self, subcollection_elem) -> Optional[Dict[str, Any]]:
         """
@@ -103,7 +228,7 @@ class CNXMLParser:
         Returns:
             Dictionary containing the subcollection structure
         """
-        title_elem = subcollection_elem.find('.//md:title', self.namespaces)
+        title_elem = self._md_title(subcollection_elem)
         if title_elem is None:
             return None
         
@@ -113,16 +238,18 @@ class CNXMLParser:
         sections = []
         modules = []
         
-        content_elem = subcollection_elem.find('col:content', self.namespaces)
-        if content_elem is not None:
+        content_elems = self._col_content(subcollection_elem)
+        if content_elems:
+            content_elem = content_elems[0]
+            
             # Parse nested subcollections (sections)
-            for nested_sub in content_elem.findall('col:subcollection', self.namespaces):
+            for nested_sub in self._col_sub(content_elem):
                 section = self._parse_subcollection(nested_sub)
                 if section:
                     sections.append(section)
             
             # Parse direct modules
-            for module_elem in content_elem.findall('col:module', self.namespaces):
+            for module_elem in self._col_mod(content_elem):
                 module_id = module_elem.get('document')
                 if module_id:
                     modules.append(module_id)
@@ -133,185 +260,320 @@ class CNXMLParser:
             'modules': modules
         }
     
-    def parse_module(self, module_id: str) -> Optional[ModuleContent]:
+    def parse_module(self, module_id: str, cache: bool = True) -> Optional[ModuleContent]:
         """
         Parse a single module file to extract its content.
         
         Args:
             module_id: The module ID (e.g., 'm66426')
+            cache: Keep the parsed module in this parser's memo; callers
+                   that cache modules themselves pass False
             
         Returns:
             ModuleContent object with all parsed data
         """
+        module_content = self._cached_module(module_id)
+        if module_content is not None:
+            return module_content
+        
         module_path = self.modules_path / module_id / "index.cnxml"
         
-        if not module_path.exists():
+        try:
+            module_content = self._parse_module_streaming(module_id, module_path)
+            if cache:
+                self._cache_module(module_id, module_content)
+            return module_content
+        except FileNotFoundError:
             print(f"Warning: Module file not found: {module_path}")
             return None
-        
-        try:
-            tree = ET.parse(module_path)
-            root = tree.getroot()
-            
-            # Extract basic metadata
-            metadata = self._extract_metadata(root)
-            title = metadata.get('title', 'Untitled')
-            
-            # Also try to get title from the document title element
-            title_elem = root.find('{http://cnx.rice.edu/cnxml}title')
-            if title_elem is not None and title_elem.text:
-                title = title_elem.text
-                metadata['title'] = title
-            
-            # Extract the main content
-            content_elem = root.find('{http://cnx.rice.edu/cnxml}content')
-            if content_elem is None:
-                # Try with namespace
-                content_elem = root.find('.//content', self.namespaces)
-            if content_elem is None:
-                # Try without namespace
-                content_elem = root.find('.//content')
-            
-            content_text = ""
-            figures = []
-            
-            if content_elem is not None:
-                content_text = self._extract_text_content(content_elem)
-                figures = self._extract_figures(content_elem)
-            
-            # Extract learning objectives and key terms
-            learning_objectives = self._extract_learning_objectives(root)
-            key_terms = self._extract_key_terms(root)
-            
-            return ModuleContent(
-                id=module_id,
-                title=title,
-                content=content_text,
-                figures=figures,
-                learning_objectives=learning_objectives,
-                key_terms=key_terms,
-                metadata=metadata
-            )
-            
         except ET.ParseError as e:
             print(f"Error parsing module {module_id}: {e}")
             return None
     
-    def _extract_metadata(self, root) -> Dict[str, Any]:
-        """Extract metadata from the module XML"""
-        metadata = {}
+    def parse_modules_parallel(self, module_ids: List[str],
+                               max_workers: Optional[int] = None,
+                               cache: bool = True) -> List[Optional[ModuleContent]]:
+        """
+        Parse many modules across CPU cores.
         
-        # Look for metadata element
-        metadata_elem = root.find('{http://cnx.rice.edu/cnxml}metadata')
-        if metadata_elem is not None:
-            # Extract title
-            title_elem = metadata_elem.find('.//{http://cnx.rice.edu/mdml}title')
-            if title_elem is not None and title_elem.text:
-                metadata['title'] = title_elem.text
+        Modules are independent, so each worker process builds its own parser
+        for this bundle and parses its share of the IDs. Modules already in
+        this parser's cache are not parsed again.
+        
+        Args:
+            module_ids: The module IDs to parse
+            max_workers: Number of worker processes (defaults to the CPU count)
+            cache: Keep the parsed modules in this parser's memo
             
-            # Extract content ID
-            content_id_elem = metadata_elem.find('.//{http://cnx.rice.edu/mdml}content-id')
-            if content_id_elem is not None and content_id_elem.text:
-                metadata['content_id'] = content_id_elem.text
+        Returns:
+            ModuleContent (or None on failure) for each ID, in the same order
+        """
+        parsed = {mid: module_content for mid in module_ids
+                  if (module_content := self._cached_module(mid)) is not None}
+        pending = [mid for mid in dict.fromkeys(module_ids) if mid not in parsed]
+        
+        if pending:
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(pending) // (workers * 4))
             
-            # Extract UUID
-            uuid_elem = metadata_elem.find('.//{http://cnx.rice.edu/mdml}uuid')
-            if uuid_elem is not None and uuid_elem.text:
-                metadata['uuid'] = uuid_elem.text
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(str(self.base_path),)) as executor:
+                results = executor.map(_parse_module_in_worker, pending,
+                                       chunksize=chunksize)
+                for module_id, module_content in zip(pending, results):
+                    if module_content is not None:
+                        parsed[module_id] = module_content
+                        if cache:
+                            self._cache_module(module_id, module_content)
         
-        return metadata
+        return [parsed.get(mid) for mid in module_ids]
     
-    def _extract_text_content(self, element) -> str:
+    def parse_modules(self, module_ids: List[str],
+                      cache: bool = True) -> List[Optional[ModuleContent]]:
         """
-        Extract plain text content from an XML element, removing markup.
+        Parse many modules in this process, reading their files in one batch.
         
-        This recursively walks through the XML tree and extracts all text content,
-        which is perfect for RAG processing where we need clean text.
-        """
-        text_parts = []
+        All uncached module files are read concurrently up front, so the many
+        small reads overlap instead of being interleaved with parsing; each
+        module is then parsed from memory.
         
-        # Get text from this element
-        if element.text:
-            text_parts.append(element.text.strip())
+        Args:
+            module_ids: The module IDs to parse
+            cache: Keep the parsed modules in this parser's memo
+            
+        Returns:
+            ModuleContent (or None on failure) for each ID, in the same order
+        """
+        parsed = {mid: module_content for mid in module_ids
+                  if (module_content := self._cached_module(mid)) is not None}
+        pending = [mid for mid in dict.fromkeys(module_ids) if mid not in parsed]
+        module_paths = [self.modules_path / mid / "index.cnxml" for mid in pending]
         
-        # Recursively get text from child elements
-        for child in element:
-            child_text = self._extract_text_content(child)
-            if child_text:
-                text_parts.append(child_text)
+        for module_id, module_path, data in zip(pending, module_paths,
+                                                self._read_modules_bulk(module_paths)):
+            if data is None:
+                print(f"Warning: Module file not found: {module_path}")
+                continue
             
-            # Don't forget tail text (text after the closing tag)
-            if child.tail:
-                text_parts.append(child.tail.strip())
+            try:
+                parsed[module_id] = self._parse_module_streaming(module_id, io.BytesIO(data))
+            except ET.ParseError as e:
+                print(f"Error parsing module {module_id}: {e}")
+                continue
+            if cache:
+                self._cache_module(module_id, parsed[module_id])
         
-        return ' '.join(filter(None, text_parts))
+        return [parsed.get(mid) for mid in module_ids]
     
-    def _extract_figures(self, content_elem) -> List[Dict[str, Any]]:
-        """Extract figure information from the content"""
+    def _cached_module(self, module_id: str) -> Optional[ModuleContent]:
+        """Look a module up in the memo, marking it as the most recently used"""
+        module_content = self._module_cache.get(module_id)
+        if module_content is not None:
+            self._module_cache.move_to_end(module_id)
+        return module_content
+    
+    def _cache_module(self, module_id: str, module_content: ModuleContent):
+        """Memoize a module, evicting the least recently used one"""
+        self._module_cache[module_id] = module_content
+        self._module_cache.move_to_end(module_id)
+        if len(self._module_cache) > self.max_cached_modules:
+            self._module_cache.popitem(last=False)
+    
+    def _read_modules_bulk(self, paths: List[Path]) -> List[Optional[bytes]]:
+        """Read module files concurrently, giving None for any that are missing"""
+        if not paths:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+            return list(executor.map(_read_file_bytes, paths))
+    
+    def _parse_module_streaming(self, module_id: str, source) -> ModuleContent:
+        """
+        Extract all module content in a single streaming pass.
+        
+        Elements are dispatched by tag as their end tags are read, so the
+        document is traversed once rather than once per kind of content.
+        Figures take their place in the list at their start tag, so a figure
+        nested inside another still follows it. Each top-level child of the document is released once it is complete.
+        
+        Args:
+            module_id: The module ID
+            source: Path or binary file object holding the module's CNXML
+        """
+        metadata = {}
+        title = None
+        content_text = ""
         figures = []
+        learning_objectives = []
+        # Insertion-ordered set: duplicates are dropped as terms are found
+        key_terms: Dict[str, None] = {}
+        
+        depth = 0
+        content_depth = None
+        content_found = False
+        
+        # Figure slots reserved at each open figure's start tag, so nested
+        # figures keep their document order
+        figure_slots = []
         
-        # Use the correct namespace for figure elements
-        for figure_elem in content_elem.findall('.//{http://cnx.rice.edu/cnxml}figure'):
-            figure_data = {
-                'id': figure_elem.get('id', ''),
-                'caption': '',
-                'media_files': []
-            }
+        # Bound once: this loop runs for every start and end tag in the module
+        extract_text = self._extract_text_content
+        
+        if isinstance(source, Path):
+            source = str(source)
+        
+        for event, elem in ET.iterparse(source, events=("start", "end"),
+                                        **PARSER_OPTIONS):
+            if event == "start":
+                depth += 1
+                tag = elem.tag
+                # The main content is the document's content element, or an
+                # un-namespaced content element in older files
+                if not content_found:
+                    if (tag == _TAG_CONTENT and depth == 2) or tag == 'content':
+                        content_depth = depth
+                        content_found = True
+                elif tag == _TAG_FIGURE and content_depth is not None:
+                    figure_slots.append(len(figures))
+                    figures.append(None)
+                continue
+            
+            tag = elem.tag
+            get = elem.get
             
-            # Extract caption
-            caption_elem = figure_elem.find('.//{http://cnx.rice.edu/cnxml}caption')
-            if caption_elem is not None:
-                figure_data['caption'] = self._extract_text_content(caption_elem)
+            if tag in _DISPATCHED_TAGS:
+                if tag in _METADATA_FIELDS:
+                    if elem.text:
+                        metadata.setdefault(_METADATA_FIELDS[tag], elem.text)
+                elif tag == _TAG_TITLE:
+                    # Document title takes precedence over the metadata title
+                    if depth == 2 and elem.text:
+                        title = elem.text
+                elif tag == _TAG_FIGURE:
+                    if content_depth is not None:
+                        figures[figure_slots.pop()] = self._parse_figure(elem)
+                elif tag == _TAG_PARA:
+                    if get('class') == 'learning-objectives':
+                        obj_text = extract_text(elem)
+                        if obj_text:
+                            learning_objectives.append(obj_text)
+                elif tag == _TAG_TERM:
+                    term_text = extract_text(elem)
+                    if term_text:
+                        key_terms[term_text] = None
+                    tag = None  # Already recorded as a key term
             
-            # Extract media files
-            for media_elem in figure_elem.findall('.//{http://cnx.rice.edu/cnxml}media'):
-                for image_elem in media_elem.findall('.//{http://cnx.rice.edu/cnxml}image'):
-                    src = image_elem.get('src', '')
-                    if src:
-                        figure_data['media_files'].append({
-                            'type': 'image',
-                            'src': src,
-                            'mime_type': image_elem.get('mime-type', ''),
-                            'alt': media_elem.get('alt', '')
-                        })
+            # Key terms: glossary terms (above), short bold emphasis, and
+            # elements with ids starting with "term-"
+            if tag is not None and depth > 1 and (
+                    (tag == _TAG_EMPHASIS and get('effect') == 'bold')
+                    or get('id', '').startswith('term-')):
+                term_text = extract_text(elem)
+                if term_text and len(term_text) < 50:  # Likely a term, not a sentence
+                    key_terms[term_text] = None
             
-            figures.append(figure_data)
+            if depth == content_depth:
+                content_text = extract_text(elem)
+                content_depth = None
+            
+            if depth == 2:
+                elem.clear()
+                if HAS_LXML:
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+            depth -= 1
+        
+        if title:
+            metadata['title'] = title
+        else:
+            title = metadata.get('title', 'Untitled')
         
-        return figures
+        return ModuleContent(
+            id=module_id,
+            title=title,
+            content=content_text,
+            figures=figures,
+            learning_objectives=learning_objectives,
+            key_terms=list(key_terms),
+            metadata=metadata
+        )
+    
+    def _extract_text_content(self, element) -> str:
+        """
+        Extract plain text content from an XML element, removing markup.
+        
+        itertext() walks the subtree in the parser's C layer; fragments are
+        joined with spaces so text from adjacent elements never runs together,
+        and whitespace is collapsed to give the clean text needed for RAG.
+        """
+        # str.split()/join() collapses whitespace faster than a compiled \s+
+        # regex substitution on the same joined text
+        return ' '.join(' '.join(element.itertext()).split())
     
-    def _extract_learning_objectives(self, root) -> List[str]:
-        """Extract learning objectives from the module"""
-        objectives = []
+    def _parse_figure(self, figure_elem) -> FigureRef:
+        """Extract figure information from a figure element"""
+        # Extract caption
+        caption = ''
+        captions = self._xp_caption(figure_elem)
+        if captions:
+            caption = self._extract_text_content(captions[0])
         
-        # Look for learning objectives in various possible locations
-        for obj_elem in root.findall('.//para[@class="learning-objectives"]'):
-            obj_text = self._extract_text_content(obj_elem)
-            if obj_text:
-                objectives.append(obj_text)
+        # Extract media files
+        media_files = []
+        for media_elem in self._xp_media(figure_elem):
+            for image_elem in self._xp_image(media_elem):
+                src = image_elem.get('src', '')
+                if src:
+                    media_files.append({
+                        'type': 'image',
+                        'src': src,
+                        'mime_type': image_elem.get('mime-type', ''),
+                        'alt': media_elem.get('alt', '')
+                    })
         
-        return objectives
+        return FigureRef(
+            id=figure_elem.get('id', ''),
+            caption=caption,
+            media_files=media_files
+        )
+
+
+def get_module_ids(base_path) -> List[str]:
+    """
+    List the IDs of all module directories in a bundle.
     
-    def _extract_key_terms(self, root) -> List[str]:
-        """Extract key terms from the module"""
-        terms = []
-        
-        # Look for emphasized terms and glossary entries
-        for term_elem in root.findall('.//term'):
-            term_text = self._extract_text_content(term_elem)
-            if term_text:
-                terms.append(term_text)
-        
-        # Also look for emphasized text that might be key terms
-        for emphasis_elem in root.findall('.//emphasis[@effect="bold"]'):
-            term_text = self._extract_text_content(emphasis_elem)
-            if term_text and len(term_text) < 50:  # Likely a term, not a sentence
-                terms.append(term_text)
-        
-        # Look for terms with id attributes starting with "term-"
-        for elem in root.findall('.//*[@id]'):
-            if elem.get('id', '').startswith('term-'):
-                term_text = self._extract_text_content(elem)
-                if term_text and len(term_text) < 50:
-                    terms.append(term_text)
-        
-        return list(set(terms))  # Remove duplicates
\ No newline at end of file
+    Args:
+        base_path: Path to the textbook bundle directory
+        
+    Returns:
+        Sorted list of module IDs, or an empty list if there are no modules
+    """
+    # scandir reports directory entries without a stat call per module
+    try:
+        with os.scandir(Path(base_path) / "modules") as entries:
+            return sorted(entry.name for entry in entries
+                          if entry.is_dir() and entry.name.startswith('m'))
+    except FileNotFoundError:
+        return []
+
+
+def _read_file_bytes(path: Path) -> Optional[bytes]:
+    """Read a whole file, or return None if it does not exist"""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+# Per-process parser used by CNXMLParser.parse_modules_parallel
+_worker_parser: Optional[CNXMLParser] = None
+
+def _init_worker(base_path: str):
+    """Create the parser used by this worker process"""
+    global _worker_parser
+    _worker_parser = CNXMLParser(base_path)
+
+def _parse_module_in_worker(module_id: str) -> Optional[ModuleContent]:
+    """Parse one module in a worker process"""
+    # The result is sent back to the parent, so the worker keeps no copy
+    return _worker_parser.parse_module(module_id, cache=False)
@@ -14,15 +14,38 @@ The parser produces structured, clean data suitable for RAG processing while
 preserving the educational structure and relationships.
 """
 
-import xml.etree.ElementTree as ET
+import hashlib
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass, field
+from functools import cached_property
 from enum import Enum
 
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+from cnxml_parser import compile_path, compile_first
+
+# lxml-only parser options; the stdlib parser accepts none of these. Comments
+# and processing instructions are dropped as the stdlib parser does, so every
+# child's tag is a string
+PARSER_OPTIONS = dict(huge_tree=True, remove_blank_text=True, remove_comments=True,
+                      remove_pis=True, collect_ids=False) if HAS_LXML else {}
+
+# Joins the text blocks of a module's flattened content
+_FLAT_SEPARATOR = '\n\n'
+
 # Define data structures for different content types
 
-@dataclass
+@dataclass(slots=True)
 class TextContent:
     """Represents formatted text content"""
     text: str
@@ -30,7 +53,7 @@ class TextContent:
     terms: List[str] = field(default_factory=list)     # key terms in this text
     links: List[Dict[str, str]] = field(default_factory=list)  # cross-references
 
-@dataclass
+@dataclass(slots=True)
 class Figure:
     """Represents a figure with media and caption"""
     id: str
@@ -38,7 +61,7 @@ class Figure:
     media_files: List[Dict[str, Any]]
     class_type: str = ""  # e.g., "splash" for chapter openers
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """Represents a data table"""
     id: str
@@ -48,7 +71,7 @@ class Table:
     rows: List[List[str]]
     class_type: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class ListItem:
     """Represents a list (bulleted, numbered, etc.)"""
     id: str
@@ -56,7 +79,7 @@ class ListItem:
     items: List[TextContent]
     number_style: str = "decimal"  # "lower-alpha", "upper-roman", etc.
 
-@dataclass
+@dataclass(slots=True)
 class Definition:
     """Represents a term definition"""
     id: str
@@ -64,7 +87,7 @@ class Definition:
     meaning: str
     context: str = ""  # surrounding context
 
-@dataclass
+@dataclass(slots=True)
 class Exercise:
     """Represents an exercise with problem and solution"""
     id: str
@@ -73,14 +96,14 @@ class Exercise:
     commentary: Optional[TextContent] = None
     exercise_type: str = "general"  # "multiple-choice", "critical-thinking", etc.
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     """Represents special notes/callouts"""
     id: str
     content: TextContent
     note_type: str = "general"  # "career", "everyday", "evolution", etc.
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """Represents a section with all its content"""
     id: str
@@ -111,11 +134,122 @@ class Module:
     # Learning objectives (from abstract)
     learning_objectives: List[str]
     
-    # All content flattened for RAG
-    all_text: str = ""
-    all_figures: List[Figure] = field(default_factory=list)
-    all_exercises: List[Exercise] = field(default_factory=list)
-    all_definitions: List[Definition] = field(default_factory=list)
+    # All content flattened for RAG, built on first access
+    @cached_property
+    def all_text_parts(self) -> List[str]:
+        return list(self.iter_flat())
+    
+    @cached_property
+    def all_text(self) -> str:
+        return _FLAT_SEPARATOR.join(self.all_text_parts)
+    
+    @cached_property
+    def all_text_length(self) -> int:
+        """len(all_text), without joining the parts"""
+        parts = self.all_text_parts
+        return sum(map(len, parts)) + len(_FLAT_SEPARATOR) * max(len(parts) - 1, 0)
+    
+    @cached_property
+    def all_figures(self) -> List[Figure]:
+        return [figure for section in self.walk_sections() for figure in section.figures]
+    
+    @cached_property
+    def all_exercises(self) -> List[Exercise]:
+        return [exercise for section in self.walk_sections() for exercise in section.exercises]
+    
+    @cached_property
+    def all_definitions(self) -> List[Definition]:
+        return self.definitions + self.glossary_terms
+    
+    @cached_property
+    def paragraph_texts(self) -> List[str]:
+        """Every paragraph's text in reading order, ready for batch tokenizing"""
+        return [para.text for section in self.walk_sections() for para in section.content]
+    
+    def walk_sections(self):
+        """Yield every section, each followed by its subsections"""
+        stack = list(reversed(self.sections))
+        while stack:
+            section = stack.pop()
+            yield section
+            stack.extend(reversed(section.subsections))
+    
+    def iter_flat(self):
+        """Yield the module's content as text blocks, in reading order"""
+        # Title and learning objectives
+        yield f"Title: {self.title}"
+        if self.learning_objectives:
+            yield "Learning Objectives:"
+            for obj in self.learning_objectives:
+                yield f"- {obj}"
+        
+        for section in self.walk_sections():
+            yield f"Section: {section.title}"
+            
+            # Paragraphs
+            for para in section.content:
+                yield para.text
+            
+            # Figures
+            for figure in section.figures:
+                yield f"Figure {figure.id}: {figure.caption}"
+            
+            # Tables
+            for table in section.tables:
+                yield f"Table {table.id}: {table.title}"
+                if table.summary:
+                    yield f"Summary: {table.summary}"
+            
+            # Lists
+            for list_item in section.lists:
+                yield f"List ({list_item.list_type}):"
+                for item in list_item.items:
+                    yield f"- {item.text}"
+            
+            # Notes
+            for note in section.notes:
+                yield f"Note ({note.note_type}): {note.content.text}"
+            
+            # Exercises
+            for exercise in section.exercises:
+                yield f"Exercise {exercise.id}: {exercise.problem.text}"
+                if exercise.solution:
+                    yield f"Solution: {exercise.solution.text}"
+        
+        # Definitions
+        for definition in self.all_definitions:
+            yield f"Definition - {definition.term}: {definition.meaning}"
+
+@dataclass(slots=True)
+class _OpenSection:
+    """A section whose content is still being collected while streaming"""
+    depth: int
+    id: str
+    section_type: str = "regular"
+    title: Optional[str] = "Untitled Section"
+    has_title: bool = False
+    content: List[TextContent] = field(default_factory=list)
+    figures: List[Optional[Figure]] = field(default_factory=list)
+    tables: List[Optional[Table]] = field(default_factory=list)
+    lists: List[Optional[ListItem]] = field(default_factory=list)
+    notes: List[Optional[Note]] = field(default_factory=list)
+    exercises: List[Optional[Exercise]] = field(default_factory=list)
+    subsections: List[Section] = field(default_factory=list)
+    
+    def to_section(self) -> Section:
+        """Build the finished section, dropping elements that parsed to nothing"""
+        return Section(
+            id=self.id,
+            title=self.title,
+            content=self.content,
+            figures=[figure for figure in self.figures if figure],
+            tables=[table for table in self.tables if table],
+            lists=[list_item for list_item in self.lists if list_item],
+            notes=[note for note in self.notes if note],
+            exercises=[exercise for exercise in self.exercises if exercise],
+            subsections=self.subsections,
+            section_type=self.section_type
+        )
 
 class CNXMLNamespace:
     """Handles CNXML namespace constants"""
@@ -128,6 +262,21 @@ class CNXMLNamespace:
         """Create a namespaced tag"""
         return f"{{{namespace}}}{element}"
 
+# Namespaced tags, built once at import time
+_TAGS = {name: CNXMLNamespace.tag(CNXMLNamespace.CNXML, name) for name in (
+    "document", "section", "para", "figure", "table", "list", "note", "exercise",
+    "item", "title", "caption", "media", "image", "tgroup", "thead", "tbody", "row",
+    "entry", "definition", "term", "meaning", "glossary", "metadata", "content",
+    "emphasis", "link", "problem", "solution", "commentary")}
+_MD_TAGS = {name: CNXMLNamespace.tag(CNXMLNamespace.MDML, name) for name in (
+    "title", "content-id", "uuid", "abstract")}
+
+# Bump when the parsed Module layout changes, so older disk cache entries are ignored
+_CACHE_VERSION = 2
+
+# Metadata fields recorded from the module's metadata block
+_METADATA_FIELDS = {_MD_TAGS[name]: name.replace('-', '_') for name in ('title', 'content-id', 'uuid')}
+
 class ComprehensiveCNXMLParser:
     """
     Comprehensive parser for CNXML biology modules.
@@ -136,13 +285,44 @@ class ComprehensiveCNXMLParser:
     and relationships between elements.
     """
     
-    def __init__(self, base_path: str = "../osbooks-biology-bundle"):
+    def __init__(self, base_path: str = "../osbooks-biology-bundle", disk_cache: bool = True,
+                 cache_dir: str = "cache/cnxml_modules"):
         self.base_path = Path(base_path)
         self.modules_path = self.base_path / "modules"
         self.collection_path = self.base_path / "collections" / "biology-2e.collection.xml"
         
+        # Parsed modules are cached on disk, keyed on their file's path, mtime
+        # and size. The cache lives with the backend's other caches rather
+        # than in the bundle, which is source data and may be read-only
+        self.disk_cache = disk_cache
+        self.cache_dir = Path(cache_dir)
+        self._cache_key_prefix = f"{_CACHE_VERSION}:{HAS_LXML}:{self.modules_path.resolve()}"
+        
         # Create namespace shortcuts
         self.ns = CNXMLNamespace()
+        self.namespaces = {'cnx': CNXMLNamespace.CNXML}
+        
+        # Element searches used by the _parse_* builders, compiled once
+        self._first_caption = compile_first('cnx:caption', self.namespaces)
+        self._xp_media = compile_path('.//cnx:media', self.namespaces)
+        self._xp_image = compile_path('.//cnx:image', self.namespaces)
+        self._first_title = compile_first('cnx:title', self.namespaces)
+        self._first_tgroup = compile_first('cnx:tgroup', self.namespaces)
+        self._first_thead = compile_first('cnx:thead', self.namespaces)
+        self._first_tbody = compile_first('cnx:tbody', self.namespaces)
+        # Rows and entries are always direct children of their table part
+        self._xp_row = compile_path('cnx:row', self.namespaces)
+        self._xp_entry = compile_path('cnx:entry', self.namespaces)
+        self._xp_item = compile_path('.//cnx:item', self.namespaces)
+        self._first_term = compile_first('cnx:term', self.namespaces)
+        self._first_meaning = compile_first('cnx:meaning', self.namespaces)
+        
+        # Inline elements whose text is also recorded separately, by exact tag
+        self._inline_handlers = {
+            _TAGS['emphasis']: self._handle_emphasis,
+            _TAGS['term']: self._handle_term,
+            _TAGS['link']: self._handle_link,
+        }
         
     def parse_module(self, module_id: str) -> Optional[Module]:
         """
@@ -156,47 +336,25 @@ class ComprehensiveCNXMLParser:
         """
         module_path = self.modules_path / module_id / "index.cnxml"
         
-        if not module_path.exists():
+        try:
+            stat = module_path.stat()
+        except FileNotFoundError:
             print(f"Warning: Module file not found: {module_path}")
             return None
         
+        cache_file = None
+        if self.disk_cache:
+            cache_file = self._cache_file(module_id, stat)
+            module = self._load_cached_module(cache_file)
+            if module is not None:
+                return module
+        
         try:
-            tree = ET.parse(module_path)
-            root = tree.getroot()
-            
-            # Extract basic metadata
-            metadata = self._extract_metadata(root)
-            title = self._extract_title(root)
-            
-            # Extract learning objectives from abstract
-            learning_objectives = self._extract_learning_objectives(root)
-            
-            # Parse the main content
-            content_elem = root.find(self.ns.tag(self.ns.CNXML, 'content'))
-            if content_elem is None:
+            module = self._parse_module_streaming(module_id, module_path)
+            if module is None:
                 print(f"Warning: No content element found in {module_id}")
-                return None
-            
-            # Parse all sections
-            sections = self._parse_sections(content_elem)
-            
-            # Extract definitions and glossary
-            definitions = self._extract_definitions(root)
-            glossary_terms = self._extract_glossary(root)
-            
-            # Create the module
-            module = Module(
-                id=module_id,
-                title=title,
-                metadata=metadata,
-                sections=sections,
-                definitions=definitions,
-                glossary_terms=glossary_terms,
-                learning_objectives=learning_objectives
-            )
-            
-            # Flatten content for RAG
-            self._flatten_content(module)
+            elif cache_file is not None:
+                self._save_cached_module(module_id, cache_file, module)
             
             return module
             
@@ -207,203 +365,251 @@ class ComprehensiveCNXMLParser:
             print(f"Unexpected error parsing module {module_id}: {e}")
             return None
     
-    def _extract_metadata(self, root) -> Dict[str, Any]:
-        """Extract metadata from the module"""
-        metadata = {}
-        
-        metadata_elem = root.find(self.ns.tag(self.ns.CNXML, 'metadata'))
-        if metadata_elem is not None:
-            # Extract various metadata fields
-            for field in ['title', 'content-id', 'uuid']:
-                elem = metadata_elem.find(f'.//{self.ns.tag(self.ns.MDML, field)}')
-                if elem is not None and elem.text:
-                    metadata[field.replace('-', '_')] = elem.text
-        
-        return metadata
-    
-    def _extract_title(self, root) -> str:
-        """Extract the module title"""
-        # Try document title first
-        title_elem = root.find(self.ns.tag(self.ns.CNXML, 'title'))
-        if title_elem is not None and title_elem.text:
-            return title_elem.text
-        
-        # Fall back to metadata title
-        metadata_elem = root.find(self.ns.tag(self.ns.CNXML, 'metadata'))
-        if metadata_elem is not None:
-            title_elem = metadata_elem.find(f'.//{self.ns.tag(self.ns.MDML, "title")}')
-            if title_elem is not None and title_elem.text:
-                return title_elem.text
-        
-        return "Untitled"
-    
-    def _extract_learning_objectives(self, root) -> List[str]:
-        """Extract learning objectives from the abstract"""
-        objectives = []
-        
-        # Look in metadata abstract
-        metadata_elem = root.find(self.ns.tag(self.ns.CNXML, 'metadata'))
-        if metadata_elem is not None:
-            abstract_elem = metadata_elem.find(f'.//{self.ns.tag(self.ns.MDML, "abstract")}')
-            if abstract_elem is not None:
-                # Extract list items from abstract
-                for item in abstract_elem.findall(f'.//{self.ns.tag(self.ns.CNXML, "item")}'):
-                    obj_text = self._extract_text_content(item)
-                    if obj_text:
-                        objectives.append(obj_text)
-        
-        return objectives
-    
-    def _parse_sections(self, content_elem) -> List[Section]:
-        """Parse all sections in the content"""
-        sections = []
-        
-        # Direct content (not in sections)
-        direct_content = self._extract_direct_content(content_elem)
-        if direct_content:
-            # Create a main section for direct content
-            main_section = Section(
-                id="main",
-                title="Main Content",
-                content=direct_content['paragraphs'],
-                figures=direct_content['figures'],
-                tables=direct_content['tables'],
-                lists=direct_content['lists'],
-                notes=direct_content['notes'],
-                exercises=direct_content['exercises'],
-                subsections=[]
-            )
-            sections.append(main_section)
-        
-        # Parse only direct child sections (not nested ones)
-        for section_elem in content_elem.findall(f'./{self.ns.tag(self.ns.CNXML, "section")}'):
-            section = self._parse_section(section_elem)
-            if section:
-                sections.append(section)
-        
-        return sections
-    
-    def _parse_section(self, section_elem) -> Optional[Section]:
-        """Parse a single section element"""
-        section_id = section_elem.get('id', '')
-        section_type = section_elem.get('class', 'regular')
-        
-        # Extract title
-        title_elem = section_elem.find(self.ns.tag(self.ns.CNXML, 'title'))
-        title = title_elem.text if title_elem is not None else "Untitled Section"
+    def _cache_file(self, module_id: str, stat: os.stat_result) -> Path:
+        """Disk cache entry for this version of a module's file"""
+        # lxml drops blank text that the stdlib parser keeps, so each parser
+        # gets its own entries; bundles sharing the cache dir never collide
+        key = f"{self._cache_key_prefix}:{stat.st_mtime_ns}:{stat.st_size}"
+        key = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+        return self.cache_dir / f"{module_id}-{key}.pkl"
+    
+    def _load_cached_module(self, cache_file: Path) -> Optional[Module]:
+        """Load a module from the disk cache, or None if it isn't cached"""
+        try:
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        except Exception as e:
+            # Corrupt files and entries pickled from an older class layout
+            # (AttributeError, TypeError, ModuleNotFoundError, ...) are
+            # dropped so the module is parsed again
+            print(f"Warning: Ignoring unreadable cache entry {cache_file}: {e}")
+            try:
+                cache_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return None
+    
+    def _save_cached_module(self, module_id: str, cache_file: Path, module: Module):
+        """Write a module to the disk cache, replacing its older entries"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale_file in self.cache_dir.glob(f"{module_id}-*.pkl"):
+                stale_file.unlink(missing_ok=True)
+            
+            # Written under a temporary name so readers never see a partial entry
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(module, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            # An unwritable cache dir would fail the same way for every
+            # module, so report it once and stop caching
+            print(f"Error saving cache entry for {module_id}: {e}; disabling the disk cache")
+            self.disk_cache = False
+    
+    def parse_modules(self, module_ids: List[str],
+                      workers: Optional[int] = None) -> List[Optional[Module]]:
+        """
+        Parse many modules across CPU cores.
         
-        # Extract content
-        content_data = self._extract_direct_content(section_elem)
+        Modules are independent, so each worker process builds its own parser
+        for this bundle and parses its share of the IDs.
         
-        # Parse direct child subsections only
-        subsections = []
-        for subsection_elem in section_elem.findall(f'./{self.ns.tag(self.ns.CNXML, "section")}'):
-            subsection = self._parse_section(subsection_elem)
-            if subsection:
-                subsections.append(subsection)
+        Args:
+            module_ids: The module IDs to parse
+            workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            Module (or None on failure) for each ID, in the same order
+        """
+        if not module_ids:
+            return []
         
-        return Section(
-            id=section_id,
-            title=title,
-            content=content_data['paragraphs'],
-            figures=content_data['figures'],
-            tables=content_data['tables'],
-            lists=content_data['lists'],
-            notes=content_data['notes'],
-            exercises=content_data['exercises'],
-            subsections=subsections,
-            section_type=section_type
-        )
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(module_ids) // (workers * 4))
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(str(self.base_path), self.disk_cache,
+                                           str(self.cache_dir))) as executor:
+            return list(executor.map(_parse_module_in_worker, module_ids,
+                                     chunksize=chunksize))
     
-    def _extract_direct_content(self, parent_elem) -> Dict[str, List]:
-        """Extract all direct content from an element"""
-        content = {
-            'paragraphs': [],
-            'figures': [],
-            'tables': [],
-            'lists': [],
-            'notes': [],
-            'exercises': []
+    def _parse_module_streaming(self, module_id: str, module_path: Path) -> Optional[Module]:
+        """
+        Parse a module in a single streaming pass.
+        
+        Open sections are kept on a stack, so every figure, table, list, note
+        and exercise lands in the innermost enclosing section without any
+        further tree searches. Each of those is built by its _parse_* method
+        once its end tag has been read, and a section's finished children are
+        released as soon as they have been dispatched.
+        
+        Args:
+            module_id: The module ID (e.g., 'm66427')
+            module_path: Path to the module's index.cnxml
+            
+        Returns:
+            Module object, or None when the module has no content element
+        """
+        tag_content = _TAGS['content']
+        tag_section = _TAGS['section']
+        tag_title = _TAGS['title']
+        tag_para = _TAGS['para']
+        tag_item = _TAGS['item']
+        tag_metadata = _TAGS['metadata']
+        tag_definition = _TAGS['definition']
+        tag_glossary = _TAGS['glossary']
+        tag_abstract = _MD_TAGS['abstract']
+        metadata_fields = _METADATA_FIELDS
+        
+        # Content elements collected into the enclosing section, and how to build them
+        builders = {
+            _TAGS['figure']: ('figures', self._parse_figure),
+            _TAGS['table']: ('tables', self._parse_table),
+            _TAGS['list']: ('lists', self._parse_list),
+            _TAGS['note']: ('notes', self._parse_note),
+            _TAGS['exercise']: ('exercises', self._parse_exercise),
         }
         
-        # Extract paragraphs
-        for para_elem in parent_elem.findall(f'./{self.ns.tag(self.ns.CNXML, "para")}'):
-            text_content = self._parse_text_content(para_elem)
-            if text_content.text.strip():
-                content['paragraphs'].append(text_content)
-        
-        # Extract figures (including nested ones in notes, etc.)
-        # But exclude figures that are in child sections
-        child_sections = parent_elem.findall(f'./{self.ns.tag(self.ns.CNXML, "section")}')
-        child_section_figures = set()
-        for child_section in child_sections:
-            for fig in child_section.findall(f'.//{self.ns.tag(self.ns.CNXML, "figure")}'):
-                child_section_figures.add(fig)
-        
-        for fig_elem in parent_elem.findall(f'.//{self.ns.tag(self.ns.CNXML, "figure")}'):
-            # Skip figures that are in child sections
-            if fig_elem not in child_section_figures:
-                figure = self._parse_figure(fig_elem)
-                if figure:
-                    content['figures'].append(figure)
-        
-        # Extract tables (including nested ones)
-        # But exclude tables that are in child sections
-        child_section_tables = set()
-        for child_section in child_sections:
-            for table_elem in child_section.findall(f'.//{self.ns.tag(self.ns.CNXML, "table")}'):
-                child_section_tables.add(table_elem)
-        
-        for table_elem in parent_elem.findall(f'.//{self.ns.tag(self.ns.CNXML, "table")}'):
-            # Skip tables that are in child sections
-            if table_elem not in child_section_tables:
-                table = self._parse_table(table_elem)
-                if table:
-                    content['tables'].append(table)
-        
-        # Extract lists (including nested ones in notes, exercises, etc.)
-        # But exclude lists that are in child sections
-        child_section_lists = set()
-        for child_section in child_sections:
-            for list_elem in child_section.findall(f'.//{self.ns.tag(self.ns.CNXML, "list")}'):
-                child_section_lists.add(list_elem)
-        
-        for list_elem in parent_elem.findall(f'.//{self.ns.tag(self.ns.CNXML, "list")}'):
-            # Skip lists that are in child sections
-            if list_elem not in child_section_lists:
-                list_item = self._parse_list(list_elem)
-                if list_item:
-                    content['lists'].append(list_item)
-        
-        # Extract notes (including nested ones)
-        # But exclude notes that are in child sections
-        child_section_notes = set()
-        for child_section in child_sections:
-            for note_elem in child_section.findall(f'.//{self.ns.tag(self.ns.CNXML, "note")}'):
-                child_section_notes.add(note_elem)
-        
-        for note_elem in parent_elem.findall(f'.//{self.ns.tag(self.ns.CNXML, "note")}'):
-            # Skip notes that are in child sections
-            if note_elem not in child_section_notes:
-                note = self._parse_note(note_elem)
-                if note:
-                    content['notes'].append(note)
-        
-        # Extract exercises (including nested ones)
-        # But exclude exercises that are in child sections
-        child_section_exercises = set()
-        for child_section in child_sections:
-            for exercise_elem in child_section.findall(f'.//{self.ns.tag(self.ns.CNXML, "exercise")}'):
-                child_section_exercises.add(exercise_elem)
-        
-        for exercise_elem in parent_elem.findall(f'.//{self.ns.tag(self.ns.CNXML, "exercise")}'):
-            # Skip exercises that are in child sections
-            if exercise_elem not in child_section_exercises:
-                exercise = self._parse_exercise(exercise_elem)
-                if exercise:
-                    content['exercises'].append(exercise)
-        
-        return content
+        document_title = None
+        metadata_values = {}
+        learning_objectives = []
+        definitions = []
+        glossary_terms = []
+        
+        depth = 0
+        metadata_depth = abstract_depth = glossary_depth = None
+        metadata_seen = abstract_seen = glossary_seen = False
+        
+        # The content element and its nested sections, innermost last
+        stack: List[_OpenSection] = []
+        content_section = None
+        
+        # Slots reserved at each open element's start tag, so that nested
+        # elements of the same kind keep their document order
+        pending = []
+        
+        for event, elem in ET.iterparse(str(module_path), events=("start", "end"),
+                                        **PARSER_OPTIONS):
+            tag = elem.tag
+            
+            if event == "start":
+                depth += 1
+                if stack:
+                    if tag in builders:
+                        bucket = getattr(stack[-1], builders[tag][0])
+                        bucket.append(None)
+                        pending.append((bucket, len(bucket) - 1))
+                    elif tag == tag_section and depth == stack[-1].depth + 1:
+                        # Only sections directly inside another section (or the
+                        # content) are sections of their own
+                        section_type = sys.intern(elem.get('class', 'regular'))
+                        stack.append(_OpenSection(depth=depth, id=elem.get('id', ''),
+                                                  section_type=section_type))
+                elif depth == 2:
+                    if tag == tag_content and content_section is None:
+                        content_section = _OpenSection(depth=depth, id="main",
+                                                       title="Main Content", has_title=True)
+                        stack.append(content_section)
+                    elif tag == tag_metadata and not metadata_seen:
+                        metadata_depth = depth
+                        metadata_seen = True
+                
+                if metadata_depth is not None and tag == tag_abstract and not abstract_seen:
+                    abstract_depth = depth
+                    abstract_seen = True
+                elif tag == tag_glossary and not glossary_seen:
+                    glossary_depth = depth
+                    glossary_seen = True
+                continue
+            
+            if stack:
+                current = stack[-1]
+                if tag in builders:
+                    bucket, index = pending.pop()
+                    bucket[index] = builders[tag][1](elem)
+                elif depth == current.depth:
+                    # The section itself has ended
+                    stack.pop()
+                    if stack:
+                        stack[-1].subsections.append(current.to_section())
+                elif depth == current.depth + 1:
+                    if tag == tag_para:
+                        text_content = self._parse_text_content(elem)
+                        if text_content.text:
+                            current.content.append(text_content)
+                    elif tag == tag_title and not current.has_title:
+                        # Titles like "Summary" repeat in every module
+                        title = elem.text
+                        current.title = sys.intern(title) if title else title
+                        current.has_title = True
+            elif depth == 2 and tag == tag_title and document_title is None:
+                document_title = elem.text or ""
+            
+            if metadata_depth is not None:
+                if tag in metadata_fields:
+                    metadata_values.setdefault(metadata_fields[tag], elem.text)
+                elif abstract_depth is not None:
+                    if tag == tag_item:
+                        # Learning objectives are the abstract's list items
+                        obj_text = self._extract_text_content(elem)
+                        if obj_text:
+                            learning_objectives.append(obj_text)
+                    elif depth == abstract_depth:
+                        abstract_depth = None
+                if depth == metadata_depth:
+                    metadata_depth = None
+            
+            if tag == tag_definition:
+                # Glossary definitions are listed both as definitions and as
+                # glossary terms
+                definition = self._parse_definition(elem)
+                if definition:
+                    definitions.append(definition)
+                    if glossary_depth is not None:
+                        glossary_terms.append(Definition(
+                            id=definition.id,
+                            term=definition.term,
+                            meaning=definition.meaning,
+                            context="glossary"
+                        ))
+            elif tag == tag_glossary and depth == glossary_depth:
+                glossary_depth = None
+            
+            # Release finished children of the document and of open sections;
+            # anything deeper may still be needed by an enclosing element
+            if depth <= 2 or (stack and depth == stack[-1].depth + 1):
+                elem.clear()
+                if HAS_LXML:
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+            depth -= 1
+        
+        if content_section is None:
+            return None
+        
+        # The content's own elements form the main section, ahead of its sections
+        sections = content_section.subsections
+        content_section.subsections = []
+        sections.insert(0, content_section.to_section())
+        
+        metadata = {key: metadata_values[key] for key in ('title', 'content_id', 'uuid')
+                    if metadata_values.get(key)}
+        
+        # Document title first, then the metadata title
+        title = document_title or metadata.get('title') or "Untitled"
+        
+        return Module(
+            id=module_id,
+            title=title,
+            metadata=metadata,
+            sections=sections,
+            definitions=definitions,
+            glossary_terms=glossary_terms,
+            learning_objectives=learning_objectives
+        )
     
     def _parse_text_content(self, element) -> TextContent:
         """Parse text content with formatting and links"""
@@ -412,44 +618,7 @@ class ComprehensiveCNXMLParser:
         terms = []
         links = []
         
-        def extract_text_recursive(elem):
-            # Add element text
-            if elem.text:
-                text_parts.append(elem.text)
-            
-            # Process child elements
-            for child in elem:
-                # Handle emphasis
-                if child.tag.endswith('emphasis'):
-                    emphasis_text = self._extract_text_content(child)
-                    text_parts.append(emphasis_text)
-                    emphasis_parts.append(emphasis_text)
-                
-                # Handle terms
-                elif child.tag.endswith('term'):
-                    term_text = self._extract_text_content(child)
-                    text_parts.append(term_text)
-                    terms.append(term_text)
-                
-                # Handle links
-                elif child.tag.endswith('link'):
-                    link_text = self._extract_text_content(child)
-                    text_parts.append(link_text)
-                    links.append({
-                        'text': link_text,
-                        'target': child.get('target-id', ''),
-                        'url': child.get('url', '')
-                    })
-                
-                # Recurse into other elements
-                else:
-                    extract_text_recursive(child)
-                
-                # Add tail text
-                if child.tail:
-                    text_parts.append(child.tail)
-        
-        extract_text_recursive(element)
+        self._collect_text(element, text_parts, emphasis_parts, terms, links)
         
         return TextContent(
             text=' '.join(text_parts).strip(),
@@ -458,25 +627,73 @@ class ComprehensiveCNXMLParser:
             links=links
         )
     
+    def _collect_text(self, elem, text_parts: List[str], emphasis_parts: List[str],
+                      terms: List[str], links: List[Dict[str, str]]):
+        """Append an element's text to text_parts, recording emphasis, terms and links"""
+        add_text = text_parts.append
+        
+        # Add element text
+        if elem.text:
+            add_text(elem.text)
+        
+        # Process child elements
+        handlers = self._inline_handlers
+        for child in elem:
+            handler = handlers.get(child.tag)
+            if handler is not None:
+                handler(child, text_parts, emphasis_parts, terms, links)
+            
+            # Recurse into other elements
+            else:
+                self._collect_text(child, text_parts, emphasis_parts, terms, links)
+            
+            # Add tail text
+            if child.tail:
+                add_text(child.tail)
+    
+    def _handle_emphasis(self, child, text_parts, emphasis_parts, terms, links):
+        """Record an emphasis element's text"""
+        emphasis_text = self._extract_text_content(child)
+        text_parts.append(emphasis_text)
+        emphasis_parts.append(emphasis_text)
+    
+    def _handle_term(self, child, text_parts, emphasis_parts, terms, links):
+        """Record a term element's text"""
+        term_text = self._extract_text_content(child)
+        text_parts.append(term_text)
+        terms.append(term_text)
+    
+    def _handle_link(self, child, text_parts, emphasis_parts, terms, links):
+        """Record a link element's text and target"""
+        link_text = self._extract_text_content(child)
+        text_parts.append(link_text)
+        links.append({
+            'text': link_text,
+            'target': child.get('target-id', ''),
+            'url': child.get('url', '')
+        })
+    
     def _parse_figure(self, fig_elem) -> Optional[Figure]:
         """Parse a figure element"""
         fig_id = fig_elem.get('id', '')
-        fig_class = fig_elem.get('class', '')
+        fig_class = sys.intern(fig_elem.get('class', ''))
         
         # Extract caption
-        caption_elem = fig_elem.find(f'.//{self.ns.tag(self.ns.CNXML, "caption")}')
+        caption_elem = self._first_caption(fig_elem)
         caption = self._extract_text_content(caption_elem) if caption_elem is not None else ""
         
         # Extract media files
         media_files = []
-        for media_elem in fig_elem.findall(f'.//{self.ns.tag(self.ns.CNXML, "media")}'):
-            for image_elem in media_elem.findall(f'.//{self.ns.tag(self.ns.CNXML, "image")}'):
+        for media_elem in self._xp_media(fig_elem):
+            # The alt text belongs to the media element, so read it once for all its images
+            alt = media_elem.get('alt', '')
+            for image_elem in self._xp_image(media_elem):
                 media_files.append({
                     'type': 'image',
                     'src': image_elem.get('src', ''),
-                    'mime_type': image_elem.get('mime-type', ''),
+                    'mime_type': sys.intern(image_elem.get('mime-type', '')),
                     'width': image_elem.get('width', ''),
-                    'alt': media_elem.get('alt', '')
+                    'alt': alt
                 })
         
         if not media_files:
@@ -492,11 +709,11 @@ class ComprehensiveCNXMLParser:
     def _parse_table(self, table_elem) -> Optional[Table]:
         """Parse a table element"""
         table_id = table_elem.get('id', '')
-        table_class = table_elem.get('class', '')
+        table_class = sys.intern(table_elem.get('class', ''))
         summary = table_elem.get('summary', '')
         
         # Extract title (if present)
-        title_elem = table_elem.find(f'.//{self.ns.tag(self.ns.CNXML, "title")}')
+        title_elem = self._first_title(table_elem)
         title = title_elem.text if title_elem is not None else ""
         
         # Extract headers and rows
@@ -504,25 +721,25 @@ class ComprehensiveCNXMLParser:
         rows = []
         
         # Find table group
-        tgroup_elem = table_elem.find(f'.//{self.ns.tag(self.ns.CNXML, "tgroup")}')
+        tgroup_elem = self._first_tgroup(table_elem)
         if tgroup_elem is not None:
             # Extract headers
-            thead_elem = tgroup_elem.find(f'.//{self.ns.tag(self.ns.CNXML, "thead")}')
+            thead_elem = self._first_thead(tgroup_elem)
             if thead_elem is not None:
-                for row_elem in thead_elem.findall(f'.//{self.ns.tag(self.ns.CNXML, "row")}'):
+                for row_elem in self._xp_row(thead_elem):
                     header_row = []
-                    for entry_elem in row_elem.findall(f'.//{self.ns.tag(self.ns.CNXML, "entry")}'):
+                    for entry_elem in self._xp_entry(row_elem):
                         header_row.append(self._extract_text_content(entry_elem))
                     if header_row:
                         headers = header_row
                         break
             
             # Extract body rows
-            tbody_elem = tgroup_elem.find(f'.//{self.ns.tag(self.ns.CNXML, "tbody")}')
+            tbody_elem = self._first_tbody(tgroup_elem)
             if tbody_elem is not None:
-                for row_elem in tbody_elem.findall(f'.//{self.ns.tag(self.ns.CNXML, "row")}'):
+                for row_elem in self._xp_row(tbody_elem):
                     row_data = []
-                    for entry_elem in row_elem.findall(f'.//{self.ns.tag(self.ns.CNXML, "entry")}'):
+                    for entry_elem in self._xp_entry(row_elem):
                         row_data.append(self._extract_text_content(entry_elem))
                     if row_data:
                         rows.append(row_data)
@@ -539,14 +756,15 @@ class ComprehensiveCNXMLParser:
     def _parse_list(self, list_elem) -> Optional[ListItem]:
         """Parse a list element"""
         list_id = list_elem.get('id', '')
-        list_type = list_elem.get('list-type', 'bulleted')
-        number_style = list_elem.get('number-style', 'decimal')
+        # These attributes take a handful of values, so share one copy of each
+        list_type = sys.intern(list_elem.get('list-type', 'bulleted'))
+        number_style = sys.intern(list_elem.get('number-style', 'decimal'))
         
         # Extract items
         items = []
-        for item_elem in list_elem.findall(f'.//{self.ns.tag(self.ns.CNXML, "item")}'):
+        for item_elem in self._xp_item(list_elem):
             item_content = self._parse_text_content(item_elem)
-            if item_content.text.strip():
+            if item_content.text:
                 items.append(item_content)
         
         if not items:
@@ -562,7 +780,7 @@ class ComprehensiveCNXMLParser:
     def _parse_note(self, note_elem) -> Optional[Note]:
         """Parse a note element"""
         note_id = note_elem.get('id', '')
-        note_type = note_elem.get('class', 'general')
+        note_type = sys.intern(note_elem.get('class', 'general'))
         
         # Extract content
         content = self._parse_text_content(note_elem)
@@ -577,8 +795,14 @@ class ComprehensiveCNXMLParser:
         """Parse an exercise element"""
         exercise_id = exercise_elem.get('id', '')
         
+        # Problem, solution and commentary are direct children, so one scan
+        # of the children finds the first of each
+        parts = {}
+        for child in exercise_elem:
+            parts.setdefault(child.tag, child)
+        
         # Extract problem
-        problem_elem = exercise_elem.find(f'.//{self.ns.tag(self.ns.CNXML, "problem")}')
+        problem_elem = parts.get(_TAGS['problem'])
         if problem_elem is None:
             return None
         
@@ -586,13 +810,13 @@ class ComprehensiveCNXMLParser:
         
         # Extract solution (if present)
         solution = None
-        solution_elem = exercise_elem.find(f'.//{self.ns.tag(self.ns.CNXML, "solution")}')
+        solution_elem = parts.get(_TAGS['solution'])
         if solution_elem is not None:
             solution = self._parse_text_content(solution_elem)
         
         # Extract commentary (if present)
         commentary = None
-        commentary_elem = exercise_elem.find(f'.//{self.ns.tag(self.ns.CNXML, "commentary")}')
+        commentary_elem = parts.get(_TAGS['commentary'])
         if commentary_elem is not None:
             commentary = self._parse_text_content(commentary_elem)
         
@@ -603,144 +827,51 @@ class ComprehensiveCNXMLParser:
             commentary=commentary
         )
     
-    def _extract_definitions(self, root) -> List[Definition]:
-        """Extract all definitions from the module"""
-        definitions = []
+    def _parse_definition(self, def_elem) -> Optional[Definition]:
+        """Parse a definition element"""
+        def_id = def_elem.get('id', '')
         
-        for def_elem in root.findall(f'.//{self.ns.tag(self.ns.CNXML, "definition")}'):
-            def_id = def_elem.get('id', '')
-            
-            # Extract term
-            term_elem = def_elem.find(f'.//{self.ns.tag(self.ns.CNXML, "term")}')
-            term = self._extract_text_content(term_elem) if term_elem is not None else ""
-            
-            # Extract meaning
-            meaning_elem = def_elem.find(f'.//{self.ns.tag(self.ns.CNXML, "meaning")}')
-            meaning = self._extract_text_content(meaning_elem) if meaning_elem is not None else ""
-            
-            if term and meaning:
-                definitions.append(Definition(
-                    id=def_id,
-                    term=term,
-                    meaning=meaning
-                ))
+        # Extract term
+        term_elem = self._first_term(def_elem)
+        term = self._extract_text_content(term_elem) if term_elem is not None else ""
         
-        return definitions
-    
-    def _extract_glossary(self, root) -> List[Definition]:
-        """Extract glossary terms"""
-        glossary_terms = []
+        # Extract meaning
+        meaning_elem = self._first_meaning(def_elem)
+        meaning = self._extract_text_content(meaning_elem) if meaning_elem is not None else ""
         
-        glossary_elem = root.find(f'.//{self.ns.tag(self.ns.CNXML, "glossary")}')
-        if glossary_elem is not None:
-            for def_elem in glossary_elem.findall(f'.//{self.ns.tag(self.ns.CNXML, "definition")}'):
-                def_id = def_elem.get('id', '')
-                
-                # Extract term
-                term_elem = def_elem.find(f'.//{self.ns.tag(self.ns.CNXML, "term")}')
-                term = self._extract_text_content(term_elem) if term_elem is not None else ""
-                
-                # Extract meaning  
-                meaning_elem = def_elem.find(f'.//{self.ns.tag(self.ns.CNXML, "meaning")}')
-                meaning = self._extract_text_content(meaning_elem) if meaning_elem is not None else ""
-                
-                if term and meaning:
-                    glossary_terms.append(Definition(
-                        id=def_id,
-                        term=term,
-                        meaning=meaning,
-                        context="glossary"
-                    ))
+        if not (term and meaning):
+            return None
         
-        return glossary_terms
+        # Terms recur across modules; meanings are prose and rarely repeat
+        return Definition(
+            id=def_id,
+            term=sys.intern(term),
+            meaning=meaning
+        )
     
     def _extract_text_content(self, element) -> str:
         """Extract plain text content from an element"""
         if element is None:
             return ""
         
-        text_parts = []
+        # Most calls are for inline elements holding a single run of text
+        if len(element) == 0:
+            text = element.text
+            return text.strip() if text else ""
         
-        # Get text from this element
-        if element.text:
-            text_parts.append(element.text.strip())
-        
-        # Recursively get text from child elements
-        for child in element:
-            child_text = self._extract_text_content(child)
-            if child_text:
-                text_parts.append(child_text)
-            
-            # Don't forget tail text
-            if child.tail:
-                text_parts.append(child.tail.strip())
-        
-        return ' '.join(filter(None, text_parts))
-    
-    def _flatten_content(self, module: Module):
-        """Flatten all content for RAG processing"""
-        all_text_parts = []
-        
-        # Add title and learning objectives
-        all_text_parts.append(f"Title: {module.title}")
-        if module.learning_objectives:
-            all_text_parts.append("Learning Objectives:")
-            for obj in module.learning_objectives:
-                all_text_parts.append(f"- {obj}")
-        
-        # Clear the aggregate lists before flattening
-        module.all_figures.clear()
-        module.all_exercises.clear()
-        module.all_definitions.clear()
-        
-        # Flatten sections
-        for section in module.sections:
-            self._flatten_section(section, all_text_parts, module)
-        
-        # Add definitions
-        for definition in module.definitions + module.glossary_terms:
-            all_text_parts.append(f"Definition - {definition.term}: {definition.meaning}")
-            module.all_definitions.append(definition)
-        
-        # Set flattened content
-        module.all_text = '\n\n'.join(all_text_parts)
-    
-    def _flatten_section(self, section: Section, text_parts: List[str], module: Module):
-        """Recursively flatten a section"""
-        text_parts.append(f"Section: {section.title}")
-        
-        # Add paragraphs
-        for para in section.content:
-            text_parts.append(para.text)
-        
-        # Add figures to module's figure list
-        for figure in section.figures:
-            module.all_figures.append(figure)
-            text_parts.append(f"Figure {figure.id}: {figure.caption}")
-        
-        # Add tables
-        for table in section.tables:
-            text_parts.append(f"Table {table.id}: {table.title}")
-            if table.summary:
-                text_parts.append(f"Summary: {table.summary}")
-        
-        # Add lists
-        for list_item in section.lists:
-            text_parts.append(f"List ({list_item.list_type}):")
-            for item in list_item.items:
-                text_parts.append(f"- {item.text}")
-        
-        # Add notes
-        for note in section.notes:
-            text_parts.append(f"Note ({note.note_type}): {note.content.text}")
-        
-        # Add exercises to module's exercise list
-        for exercise in section.exercises:
-            module.all_exercises.append(exercise)
-            text_parts.append(f"Exercise {exercise.id}: {exercise.problem.text}")
-            if exercise.solution:
-                text_parts.append(f"Solution: {exercise.solution.text}")
-        
-        # Recurse into subsections
-        for subsection in section.subsections:
-            self._flatten_section(subsection, text_parts, module)
\ No newline at end of file
+        # itertext yields the subtree's text and tails in document order
+        return ' '.join([text for text in map(str.strip, element.itertext()) if text])
+
+
+# Parsed trees can't be shared across processes, so each worker process
+# parses with its own parser for the bundle
+_worker_parser: Optional[ComprehensiveCNXMLParser] = None
+
+def _init_worker(base_path: str, disk_cache: bool, cache_dir: str):
+    """Create the parser used by this worker process"""
+    global _worker_parser
+    _worker_parser = ComprehensiveCNXMLParser(base_path, disk_cache, cache_dir)
+
+def _parse_module_in_worker(module_id: str) -> Optional[Module]:
+    """Parse one module in a worker process"""
+    return _worker_parser.parse_module(module_id)
@@ -7,17 +7,49 @@ with very high confidence before moving to the next phase.
 """
 
 import json
-import xml.etree.ElementTree as ET
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from collections import defaultdict
 from comprehensive_cnxml_parser import ComprehensiveCNXMLParser
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Section types every full module is expected to contain
+_EXPECTED_SECTION_TYPES = frozenset(('regular', 'summary', 'multiple-choice',
+                                     'critical-thinking', 'visual-exercise'))
+
+# (content type, module_data flag) pairs checked for each module
+_CONSISTENCY_CHECKS = (
+    ('learning_objectives', 'has_learning_objectives'),
+    ('figures', 'has_figures'),
+    ('exercises', 'has_exercises'),
+    ('definitions', 'has_definitions'),
+    ('glossary', 'has_glossary'),
+    ('flattened_content', 'has_flattened_content')
+)
+
+def _has_duplicates(values):
+    """Check for a repeated value, stopping at the first one found"""
+    seen = set()
+    for value in values:
+        if value in seen:
+            return True
+        seen.add(value)
+    return False
+
 class ParserValidator:
     """Comprehensive validation suite for the CNXML parser"""
     
     def __init__(self, base_path="../osbooks-biology-bundle"):
         self.base_path = Path(base_path)
-        self.parser = ComprehensiveCNXMLParser()
+        self.parser = ComprehensiveCNXMLParser(base_path)
         self.validation_results = {
             'total_modules_tested': 0,
             'successful_parses': 0,
@@ -27,6 +59,13 @@ class ParserValidator:
             'edge_cases_tested': 0,
             'performance_metrics': {}
         }
+        self._cache = {}
+    
+    def _parse(self, module_id):
+        """Parse a module once per validator run, remembering failures too"""
+        if module_id not in self._cache:
+            self._cache[module_id] = self.parser.parse_module(module_id)
+        return self._cache[module_id]
     
     def validate_known_content_counts(self):
         """Validate against manually verified content counts"""
@@ -64,7 +103,7 @@ class ParserValidator:
         
         for module_id, expected in known_counts.items():
             print(f"\nValidating {module_id}:")
-            module = self.parser.parse_module(module_id)
+            module = self._parse(module_id)
             
             if not module:
                 print(f"  ✗ Failed to parse module {module_id}")
@@ -103,51 +142,51 @@ class ParserValidator:
         
         for module_id in test_modules:
             print(f"\nChecking content quality for {module_id}:")
-            module = self.parser.parse_module(module_id)
+            module = self._parse(module_id)
             
             if not module:
                 quality_checks_passed = False
                 continue
             
             # Check 1: All figures should have captions
-            figures_without_captions = [f for f in module.all_figures if not f.caption.strip()]
+            figures_without_captions = sum(1 for f in module.all_figures if not f.caption.strip())
             if figures_without_captions:
-                print(f"  ✗ {len(figures_without_captions)} figures without captions")
+                print(f"  ✗ {figures_without_captions} figures without captions")
                 quality_checks_passed = False
             else:
                 print(f"  ✓ All {len(module.all_figures)} figures have captions")
             
             # Check 2: All exercises should have problems
-            exercises_without_problems = [e for e in module.all_exercises if not e.problem.text.strip()]
+            exercises_without_problems = sum(1 for e in module.all_exercises if not e.problem.text.strip())
             if exercises_without_problems:
-                print(f"  ✗ {len(exercises_without_problems)} exercises without problems")
+                print(f"  ✗ {exercises_without_problems} exercises without problems")
                 quality_checks_passed = False
             else:
                 print(f"  ✓ All {len(module.all_exercises)} exercises have problems")
             
             # Check 3: All definitions should have terms and meanings
-            incomplete_definitions = [d for d in module.definitions if not d.term.strip() or not d.meaning.strip()]
+            incomplete_definitions = sum(1 for d in module.definitions if not d.term.strip() or not d.meaning.strip())
             if incomplete_definitions:
-                print(f"  ✗ {len(incomplete_definitions)} incomplete definitions")
+                print(f"  ✗ {incomplete_definitions} incomplete definitions")
                 quality_checks_passed = False
             else:
                 print(f"  ✓ All {len(module.definitions)} definitions are complete")
             
             # Check 4: Sections should have proper hierarchy
-            sections_without_titles = [s for s in module.sections if not s.title.strip()]
+            sections_without_titles = sum(1 for s in module.sections if not s.title.strip())
             if sections_without_titles:
-                print(f"  ✗ {len(sections_without_titles)} sections without titles")
+                print(f"  ✗ {sections_without_titles} sections without titles")
                 quality_checks_passed = False
             else:
                 print(f"  ✓ All {len(module.sections)} sections have titles")
             
             # Check 5: Flattened content should be substantial
             min_expected_content_length = 10000  # At least 10KB of text
-            if len(module.all_text) < min_expected_content_length:
-                print(f"  ✗ Flattened content too short: {len(module.all_text)} chars")
+            if module.all_text_length < min_expected_content_length:
+                print(f"  ✗ Flattened content too short: {module.all_text_length} chars")
                 quality_checks_passed = False
             else:
-                print(f"  ✓ Flattened content length: {len(module.all_text)} chars")
+                print(f"  ✓ Flattened content length: {module.all_text_length} chars")
         
         return quality_checks_passed
     
@@ -158,22 +197,26 @@ class ParserValidator:
         structure_tests_passed = True
         
         # Test module with complex nested structure
-        module = self.parser.parse_module('m66427')
+        module = self._parse('m66427')
         if not module:
             return False
         
         # Check 1: Nested sections are properly extracted
-        sections_with_subsections = [s for s in module.sections if s.subsections]
+        sections_with_subsections = 0
+        total_subsections = 0
+        for section in module.sections:
+            if section.subsections:
+                sections_with_subsections += 1
+                total_subsections += len(section.subsections)
+        
         if not sections_with_subsections:
             print("  ✗ No nested sections found (expected some)")
             structure_tests_passed = False
         else:
-            total_subsections = sum(len(s.subsections) for s in sections_with_subsections)
-            print(f"  ✓ Found {len(sections_with_subsections)} sections with {total_subsections} subsections")
+            print(f"  ✓ Found {sections_with_subsections} sections with {total_subsections} subsections")
         
         # Check 2: Content is not duplicated between parent and child sections
-        all_figure_ids = [f.id for f in module.all_figures]
-        if len(all_figure_ids) != len(set(all_figure_ids)):
+        if _has_duplicates(f.id for f in module.all_figures):
             print("  ✗ Duplicate figures found in aggregated list")
             structure_tests_passed = False
         else:
@@ -181,8 +224,7 @@ class ParserValidator:
         
         # Check 3: Different section types are properly identified
         section_types = {s.section_type for s in module.sections}
-        expected_types = {'regular', 'summary', 'multiple-choice', 'critical-thinking', 'visual-exercise'}
-        if not expected_types.issubset(section_types):
+        if not _EXPECTED_SECTION_TYPES.issubset(section_types):
             print(f"  ✗ Missing expected section types. Found: {section_types}")
             structure_tests_passed = False
         else:
@@ -197,7 +239,7 @@ class ParserValidator:
         edge_case_tests_passed = True
         
         # Test 1: Non-existent module
-        non_existent = self.parser.parse_module('m99999')
+        non_existent = self._parse('m99999')
         if non_existent is not None:
             print("  ✗ Non-existent module should return None")
             edge_case_tests_passed = False
@@ -208,7 +250,7 @@ class ParserValidator:
         # Find a module with fewer elements to test minimal content handling
         minimal_modules = ['m66436']  # Carbon module (smaller)
         for module_id in minimal_modules:
-            module = self.parser.parse_module(module_id)
+            module = self._parse(module_id)
             if module:
                 print(f"  ✓ Successfully parsed minimal module {module_id}")
                 print(f"    - Sections: {len(module.sections)}")
@@ -225,8 +267,6 @@ class ParserValidator:
         """Test parser performance on multiple modules"""
         print("\n=== Validating Performance ===")
         
-        import time
-        
         # Test modules (actual biology modules from different ranges)
         test_modules = [
             'm66427', 'm66428', 'm66429', 'm66430', 'm66436',  # Known working modules
@@ -235,39 +275,54 @@ class ParserValidator:
         ]
         
         successful_parses = 0
-        total_parse_time = 0
-        
-        for module_id in test_modules:
-            start_time = time.time()
-            module = self.parser.parse_module(module_id)
-            parse_time = time.time() - start_time
-            
-            if module:
+        parse_times = []
+        
+        # Modules are independent, so parse them across CPU cores
+        wall_start = time.perf_counter_ns()
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker,
+                                 initargs=(str(self.base_path),)) as executor:
+            results = list(executor.map(_parse_one, test_modules))
+        wall_time = (time.perf_counter_ns() - wall_start) / 1e9
+        
+        for module_id, parse_time_ns, text_length, success in results:
+            parse_time = parse_time_ns / 1e9
+            if success:
                 successful_parses += 1
-                print(f"  ✓ {module_id}: {parse_time:.3f}s - {len(module.all_text)} chars")
+                print(f"  ✓ {module_id}: {parse_time:.3f}s - {text_length} chars")
             else:
                 print(f"  ✗ {module_id}: Failed to parse")
             
-            total_parse_time += parse_time
+            parse_times.append(parse_time)
         
+        total_parse_time = sum(parse_times)
         avg_parse_time = total_parse_time / len(test_modules)
         success_rate = successful_parses / len(test_modules)
         
+        # Percentiles show slow outliers that the mean hides
+        percentiles = statistics.quantiles(parse_times, n=100, method='inclusive')
+        p50_parse_time = statistics.median(parse_times)
+        p99_parse_time = percentiles[98]
+        
         print(f"\nPerformance Summary:")
         print(f"  Success rate: {success_rate:.1%} ({successful_parses}/{len(test_modules)})")
         print(f"  Average parse time: {avg_parse_time:.3f}s")
+        print(f"  P50 / P99 parse time: {p50_parse_time:.3f}s / {p99_parse_time:.3f}s")
         print(f"  Total parse time: {total_parse_time:.3f}s")
+        print(f"  Wall time: {wall_time:.3f}s")
         
         self.validation_results['performance_metrics'] = {
             'modules_tested': len(test_modules),
             'successful_parses': successful_parses,
             'success_rate': success_rate,
             'avg_parse_time_seconds': avg_parse_time,
-            'total_parse_time_seconds': total_parse_time
+            'p50_parse_time_seconds': p50_parse_time,
+            'p99_parse_time_seconds': p99_parse_time,
+            'total_parse_time_seconds': total_parse_time,
+            'wall_time_seconds': wall_time
         }
         
-        # Performance should be reasonable (< 1 second per module on average)
-        return avg_parse_time < 1.0 and success_rate > 0.8
+        # Performance should be reasonable (even the slowest modules under 2 seconds)
+        return p99_parse_time < 2.0 and success_rate > 0.8
     
     def validate_content_consistency(self):
         """Validate that content extraction is consistent across similar modules"""
@@ -279,7 +334,7 @@ class ParserValidator:
         
         modules_data = []
         for module_id in test_modules:
-            module = self.parser.parse_module(module_id)
+            module = self._parse(module_id)
             if module:
                 modules_data.append({
                     'id': module_id,
@@ -290,7 +345,7 @@ class ParserValidator:
                     'has_exercises': len(module.all_exercises) > 0,
                     'has_definitions': len(module.definitions) > 0,
                     'has_glossary': len(module.glossary_terms) > 0,
-                    'has_flattened_content': len(module.all_text) > 0
+                    'has_flattened_content': module.all_text_length > 0
                 })
         
         print(f"Analyzed {len(modules_data)} modules for consistency:")
@@ -298,16 +353,7 @@ class ParserValidator:
         # Check that all modules have expected content types
         for module_data in modules_data:
             module_id = module_data['id']
-            checks = [
-                ('learning_objectives', module_data['has_learning_objectives']),
-                ('figures', module_data['has_figures']),
-                ('exercises', module_data['has_exercises']),
-                ('definitions', module_data['has_definitions']),
-                ('glossary', module_data['has_glossary']),
-                ('flattened_content', module_data['has_flattened_content'])
-            ]
-            
-            failed_checks = [name for name, passed in checks if not passed]
+            failed_checks = [name for name, flag in _CONSISTENCY_CHECKS if not module_data[flag]]
             if failed_checks:
                 print(f"  ✗ {module_id}: Missing {', '.join(failed_checks)}")
                 consistency_passed = False
@@ -379,13 +425,37 @@ class ParserValidator:
         self.validation_results['test_results'] = test_results
         self.validation_results['overall_success'] = all_tests_passed
         
-        with open('parser_validation_results.json', 'w') as f:
-            json.dump(self.validation_results, f, indent=2)
+        if HAS_ORJSON:
+            with open('parser_validation_results.json', 'wb') as f:
+                f.write(orjson.dumps(self.validation_results, option=orjson.OPT_INDENT_2))
+        else:
+            # Raw UTF-8 like orjson, so the file is the same either way
+            with open('parser_validation_results.json', 'w', encoding='utf-8') as f:
+                json.dump(self.validation_results, f, indent=2, ensure_ascii=False)
         
         print(f"\n📄 Detailed results saved to: parser_validation_results.json")
         
         return all_tests_passed
 
+# Each performance worker process times parses with its own parser. The
+# disk cache is off so the timings measure parsing rather than cache loads.
+_worker_parser = None
+
+def _init_worker(base_path):
+    """Create the parser used by this worker process"""
+    global _worker_parser
+    _worker_parser = ComprehensiveCNXMLParser(base_path, disk_cache=False)
+
+def _parse_one(module_id):
+    """Time one parse, returning (module_id, parse_time_ns, text_length, success)"""
+    start_time = time.perf_counter_ns()
+    module = _worker_parser.parse_module(module_id)
+    parse_time_ns = time.perf_counter_ns() - start_time
+    
+    if not module:
+        return module_id, parse_time_ns, 0, False
+    return module_id, parse_time_ns, module.all_text_length, True
+
 def main():
     """Run the comprehensive validation suite"""
     validator = ParserValidator()
@@ -3,7 +3,9 @@ StudyLink Backend API
 Main FastAPI application for the RAG-powered biology study tool.
 """
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Dict, Any
@@ -12,21 +14,34 @@ import os
 from cnxml_parser import CNXMLParser
 from textbook_processor import TextbookProcessor
 
-app = FastAPI(title="StudyLink API", version="1.0.0")
+# Initialize our processors; the processor reuses the same parser
+parser = CNXMLParser()
+processor = TextbookProcessor(parser=parser)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Parse every module once at startup and preload the module cache"""
+    # Warm up off the event loop; if the bundle is missing or broken, start
+    # anyway with a cold cache so the endpoints can report the error
+    try:
+        module_count = await asyncio.to_thread(processor.warm_cache)
+        print(f"Warmed module cache with {module_count} modules")
+    except Exception as e:
+        print(f"Error warming module cache: {e}")
+    yield
+
+app = FastAPI(title="StudyLink API", version="1.0.0", lifespan=lifespan)
 
 # Enable CORS for React frontend
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173"],  # Vite dev server
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=600,  # Let browsers reuse preflight responses for 10 minutes
 )
 
-# Initialize our processors
-parser = CNXMLParser()
-processor = TextbookProcessor()
-
 class ChatMessage(BaseModel):
     message: str
     context: str = ""
@@ -59,12 +74,14 @@ async def get_module_content(module_id: str):
     Returns parsed text, figures, and metadata.
     """
     try:
-        content = processor.get_module_content(module_id)
-        if not content:
-            raise HTTPException(status_code=404, detail="Module not found")
-        return content
+        # Modules are serialized once, so return the cached JSON bytes as-is
+        content = processor.get_module_json(module_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    if not content:
+        raise HTTPException(status_code=404, detail="Module not found")
+    return Response(content=content, media_type="application/json")
 
 @app.post("/chat")
 async def chat_with_textbook(message: ChatMessage):
@@ -0,0 +1,39 @@
+"""
+Tests for the streaming CNXML module parser.
+
+Each test writes the module it needs under pytest's tmp_path.
+"""
+
+from cnxml_parser import CNXMLParser
+
+NESTED_FIGURES_MODULE = """<?xml version="1.0" encoding="UTF-8"?>
+<document xmlns="http://cnx.rice.edu/cnxml">
+  <title>Nested Figures</title>
+  <content>
+    <figure id="fig-before"><caption>Before</caption></figure>
+    <figure id="fig-outer">
+      <subfigure id="subfig-1">
+        <figure id="fig-inner"><caption>Inner</caption></figure>
+      </subfigure>
+      <caption>Outer</caption>
+    </figure>
+    <note id="note-1">
+      <figure id="fig-in-note"><caption>In note</caption></figure>
+    </note>
+    <figure id="fig-after"><caption>After</caption></figure>
+  </content>
+</document>
+"""
+
+def test_nested_figures_keep_document_order(tmp_path):
+    """Figures come out in document order, outer figures before inner ones"""
+    module_path = tmp_path / "modules" / "m00001"
+    module_path.mkdir(parents=True)
+    (module_path / "index.cnxml").write_text(NESTED_FIGURES_MODULE)
+
+    module = CNXMLParser(str(tmp_path)).parse_module('m00001')
+
+    assert [figure.id for figure in module.figures] == [
+        'fig-before', 'fig-outer', 'fig-inner', 'fig-in-note', 'fig-after'
+    ]
+    assert module.figures[2].caption == 'Inner'
@@ -6,21 +6,58 @@ This script tests all the educational content extraction capabilities.
 """
 
 from comprehensive_cnxml_parser import ComprehensiveCNXMLParser
+from contextlib import redirect_stdout
+import io
 import json
+import sys
 
-def test_parser_comprehensive():
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import pytest
+    HAS_PYTEST = True
+except ImportError:
+    HAS_PYTEST = False
+
+# Every module the tests below look at
+TEST_MODULE_IDS = ['m66427', 'm66428', 'm66430', 'm66436', 'm66437']
+
+def parse_test_modules(parser):
+    """Parse each test module once so every test can share the result"""
+    return {module_id: parser.parse_module(module_id) for module_id in TEST_MODULE_IDS}
+
+if HAS_PYTEST:
+    @pytest.fixture(scope="module")
+    def parser():
+        """One parser shared by every test in this file"""
+        return ComprehensiveCNXMLParser()
+    
+    @pytest.fixture(scope="module")
+    def modules(parser):
+        """The test modules, parsed once for the whole file"""
+        return parse_test_modules(parser)
+
+def get_module(parser, modules, module_id):
+    """Return the already parsed module, parsing it only if it is missing"""
+    if module_id not in modules:
+        modules[module_id] = parser.parse_module(module_id)
+    return modules[module_id]
+
+def test_parser_comprehensive(parser, modules):
     """Test the comprehensive parser with detailed output"""
     print("=== Testing Comprehensive CNXML Parser ===")
     
-    parser = ComprehensiveCNXMLParser()
-    
     # Test with a content-rich module - focus on m66427 for detailed debugging
     test_modules = ['m66427', 'm66428', 'm66430', 'm66436']  # Science of Biology, Themes, Chemical Foundation
     
     for module_id in test_modules:
         print(f"\n--- Testing Module: {module_id} ---")
         
-        module = parser.parse_module(module_id)
+        module = get_module(parser, modules, module_id)
         
         if module is None:
             print(f"✗ Failed to parse module {module_id}")
@@ -96,14 +133,12 @@ def test_parser_comprehensive():
         
         print()
 
-def test_specific_content_types():
+def test_specific_content_types(parser, modules):
     """Test specific content types in detail"""
     print("=== Testing Specific Content Types ===")
     
-    parser = ComprehensiveCNXMLParser()
-    
     # Test with a module known to have exercises
-    module = parser.parse_module('m66427')
+    module = get_module(parser, modules, 'm66427')
     if module is None:
         print("✗ Failed to parse test module")
         return
@@ -117,7 +152,7 @@ def test_specific_content_types():
     total_terms = 0
     total_links = 0
     
-    for section in module.sections:
+    for section in module.walk_sections():
         for para in section.content:
             total_paragraphs += 1
             total_emphasis += len(para.emphasis)
@@ -147,12 +182,10 @@ def test_specific_content_types():
     for section_type, count in section_types.items():
         print(f"  {section_type}: {count}")
 
-def test_educational_structure():
+def test_educational_structure(parser, modules):
     """Test educational structure parsing"""
     print("=== Testing Educational Structure ===")
     
-    parser = ComprehensiveCNXMLParser()
-    
     # Test multiple modules for comprehensive coverage
     test_modules = ['m66427', 'm66428', 'm66430', 'm66437']
     
@@ -170,7 +203,7 @@ def test_educational_structure():
     }
     
     for module_id in test_modules:
-        module = parser.parse_module(module_id)
+        module = get_module(parser, modules, module_id)
         if module:
             total_stats['modules'] += 1
             total_stats['sections'] += len(module.sections)
@@ -179,8 +212,8 @@ def test_educational_structure():
             total_stats['definitions'] += len(module.definitions)
             total_stats['glossary_terms'] += len(module.glossary_terms)
             
-            # Count content in sections
-            for section in module.sections:
+            # Count content in sections and their subsections
+            for section in module.walk_sections():
                 total_stats['paragraphs'] += len(section.content)
                 total_stats['tables'] += len(section.tables)
                 total_stats['lists'] += len(section.lists)
@@ -199,12 +232,19 @@ def test_educational_structure():
                 avg = value / total_stats['modules']
                 print(f"  {key.replace('_', ' ').title()}: {avg:.1f}")
 
-def debug_m66427_detailed():
+def debug_m66427_detailed(parser, modules):
     """Detailed debugging output for m66427"""
+    # Collect the report's many lines and write them to the terminal at once
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        _debug_m66427_report(parser, modules)
+    sys.stdout.write(buffer.getvalue())
+
+def _debug_m66427_report(parser, modules):
+    """Print the detailed m66427 report"""
     print("=== Detailed Debug: m66427 ===")
     
-    parser = ComprehensiveCNXMLParser()
-    module = parser.parse_module('m66427')
+    module = get_module(parser, modules, 'm66427')
     
     if not module:
         print("✗ Failed to parse m66427")
@@ -290,51 +330,34 @@ def debug_m66427_detailed():
         if exercise.commentary:
             print(f"     Commentary: {exercise.commentary.text[:100]}...")
     
-    # Show lists with details
+    # Show lists with details; anything not at the top level is a subsection
+    top_level = {id(section) for section in module.sections}
     print(f"\nLists (found in sections):")
     list_count = 0
-    for section in module.sections:
+    for section in module.walk_sections():
+        kind = "section" if id(section) in top_level else "subsection"
         for list_item in section.lists:
             list_count += 1
-            print(f"  {list_count}. {list_item.id} in section '{section.title}'")
+            print(f"  {list_count}. {list_item.id} in {kind} '{section.title}'")
             print(f"     Type: {list_item.list_type}, Style: {list_item.number_style}")
             print(f"     Items: {len(list_item.items)}")
             for j, item in enumerate(list_item.items[:3]):
                 print(f"       {j+1}. {item.text[:80]}...")
-        
-        for subsection in section.subsections:
-            for list_item in subsection.lists:
-                list_count += 1
-                print(f"  {list_count}. {list_item.id} in subsection '{subsection.title}'")
-                print(f"     Type: {list_item.list_type}, Style: {list_item.number_style}")
-                print(f"     Items: {len(list_item.items)}")
-                for j, item in enumerate(list_item.items[:3]):
-                    print(f"       {j+1}. {item.text[:80]}...")
     
     # Show tables with details
     print(f"\nTables (found in sections):")
     table_count = 0
-    for section in module.sections:
+    for section in module.walk_sections():
+        kind = "section" if id(section) in top_level else "subsection"
         for table in section.tables:
             table_count += 1
-            print(f"  {table_count}. {table.id} in section '{section.title}'")
+            print(f"  {table_count}. {table.id} in {kind} '{section.title}'")
             print(f"     Title: {table.title}")
             print(f"     Summary: {table.summary}")
             print(f"     Headers: {table.headers}")
             print(f"     Rows: {len(table.rows)}")
             if table.rows:
                 print(f"     Sample row: {table.rows[0]}")
-        
-        for subsection in section.subsections:
-            for table in subsection.tables:
-                table_count += 1
-                print(f"  {table_count}. {table.id} in subsection '{subsection.title}'")
-                print(f"     Title: {table.title}")
-                print(f"     Summary: {table.summary}")
-                print(f"     Headers: {table.headers}")
-                print(f"     Rows: {len(table.rows)}")
-                if table.rows:
-                    print(f"     Sample row: {table.rows[0]}")
     
     print(f"\n=== Learning Objectives ===")
     for i, obj in enumerate(module.learning_objectives):
@@ -345,12 +368,11 @@ def debug_m66427_detailed():
     print(f"Lines in flattened text: {len(module.all_text.split('\\n'))}")
     print(f"First 300 chars: {module.all_text[:300]}...")
 
-def save_sample_output():
+def save_sample_output(parser, modules):
     """Save sample parsed output for inspection"""
     print("=== Saving Sample Output ===")
     
-    parser = ComprehensiveCNXMLParser()
-    module = parser.parse_module('m66427')
+    module = get_module(parser, modules, 'm66427')
     
     if module:
         # Convert to dict for JSON serialization
@@ -382,8 +404,13 @@ def save_sample_output():
             } if module.all_exercises else None
         }
         
-        with open('sample_parsed_output.json', 'w') as f:
-            json.dump(sample_data, f, indent=2)
+        if HAS_ORJSON:
+            with open('sample_parsed_output.json', 'wb') as f:
+                f.write(orjson.dumps(sample_data, option=orjson.OPT_INDENT_2))
+        else:
+            # Raw UTF-8 like orjson, so the file is the same either way
+            with open('sample_parsed_output.json', 'w', encoding='utf-8') as f:
+                json.dump(sample_data, f, indent=2, ensure_ascii=False)
         
         print("✓ Sample output saved to sample_parsed_output.json")
         
@@ -394,7 +421,11 @@ def save_sample_output():
         print("✓ Flattened content sample saved to sample_flattened_content.txt")
 
 if __name__ == "__main__":
-    test_parser_comprehensive()
-    test_specific_content_types()
-    test_educational_structure()
-    save_sample_output()
+    # Parse each test module once and share it across all the tests
+    parser = ComprehensiveCNXMLParser()
+    modules = parse_test_modules(parser)
+    
+    test_parser_comprehensive(parser, modules)
+    test_specific_content_types(parser, modules)
+    test_educational_structure(parser, modules)
+    save_sample_output(parser, modules)
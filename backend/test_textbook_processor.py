@@ -0,0 +1,58 @@
+"""
+Tests for the textbook processor's module caching.
+
+Each test builds a small bundle under pytest's tmp_path and runs from there,
+since the processor keeps its cache in ./cache.
+"""
+
+from textbook_processor import TextbookProcessor
+
+COLLECTION_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<col:collection xmlns="http://cnx.rice.edu/collxml" xmlns:col="http://cnx.rice.edu/collxml" xmlns:md="http://cnx.rice.edu/mdml">
+  <col:metadata><md:title>Biology 2e</md:title></col:metadata>
+  <col:content>
+    <col:subcollection>
+      <md:title>Chapter</md:title>
+      <col:content>{modules}</col:content>
+    </col:subcollection>
+  </col:content>
+</col:collection>
+"""
+
+MODULE_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<document xmlns="http://cnx.rice.edu/cnxml">
+  <title>Module {module_id}</title>
+  <content>
+    <para id="para-1">Cells are the basic unit of life. Module {module_id}.</para>
+  </content>
+</document>
+"""
+
+def write_bundle(bundle_path, module_ids):
+    """Write a one-chapter bundle holding the given modules"""
+    collections_path = bundle_path / "collections"
+    collections_path.mkdir(parents=True)
+    modules = ''.join(f'<col:module document="{mid}"/>' for mid in module_ids)
+    (collections_path / "biology-2e.collection.xml").write_text(
+        COLLECTION_TEMPLATE.format(modules=modules))
+
+    for module_id in module_ids:
+        module_path = bundle_path / "modules" / module_id
+        module_path.mkdir(parents=True)
+        (module_path / "index.cnxml").write_text(MODULE_TEMPLATE.format(module_id=module_id))
+    return bundle_path
+
+def test_bulk_pass_leaves_parser_memo_empty(tmp_path, monkeypatch):
+    """A full get_all_modules pass keeps no module in memory afterwards"""
+    module_ids = ['m00001', 'm00002', 'm00003']
+    bundle_path = write_bundle(tmp_path / "bundle", module_ids)
+    monkeypatch.chdir(tmp_path)
+
+    processor = TextbookProcessor(str(bundle_path), max_cached_modules=1)
+
+    # First pass parses every module, the second loads them from disk
+    for _ in range(2):
+        modules = list(processor.get_all_modules())
+        assert [module['id'] for module in modules] == module_ids
+        assert processor.parser._module_cache == {}
+        assert len(processor._modules_cache) == 0
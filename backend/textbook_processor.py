@@ -8,12 +8,30 @@ and preparation for RAG processing.
 
 import json
 import os
-from typing import Dict, List, Any, Optional
+import re
+import sqlite3
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from itertools import chain
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from pathlib import Path
 import pickle
 
 from cnxml_parser import CNXMLParser, ModuleContent, TextbookStructure
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Tokens recorded in the search index
+_WORD_RE = re.compile(r'\w+')
+# Punctuation that ends a sentence; it must be followed by whitespace so
+# decimals ("pH 7.4") and abbreviations ("e.g.") are not split
+_SENTENCE_END_RE = re.compile(r'[.!?](?=\s)')
+
 class TextbookProcessor:
     """
     Processes and manages the Biology 2e textbook content.
@@ -22,24 +40,48 @@ class TextbookProcessor:
     handles caching for performance, and prepares content for RAG processing.
     """
     
-    def __init__(self, base_path: str = "../osbooks-biology-bundle"):
+    def __init__(self, base_path: str = "../osbooks-biology-bundle",
+                 parser: Optional[CNXMLParser] = None,
+                 max_cached_modules: int = 128):
         """
         Initialize the textbook processor.
         
         Args:
             base_path: Path to the textbook bundle directory
+            parser: An existing parser to share (base_path is ignored if given)
+            max_cached_modules: How many modules (dictionary and JSON) to keep
+                                in memory; the least recently used are dropped first
         """
-        self.parser = CNXMLParser(base_path)
+        self.parser = parser if parser is not None else CNXMLParser(base_path)
         self.cache_dir = Path("cache")
         self.cache_dir.mkdir(exist_ok=True)
         
-        # Cache files
+        # Cache files; modules are stored one row each so caching a module
+        # never rewrites the others
         self.structure_cache_file = self.cache_dir / "textbook_structure.pickle"
-        self.modules_cache_file = self.cache_dir / "modules_cache.pickle"
+        self.modules_db_file = self.cache_dir / "modules.sqlite"
+        self.legacy_modules_cache_file = self.cache_dir / "modules_cache.pickle"
+        self.search_index_file = self.cache_dir / "inverted_index.pickle"
         
-        # In-memory caches
+        # In-memory caches; modules are kept in least recently used order
+        # and reloaded from disk once evicted. Modules are parsed without the
+        # parser's own memo, so this is the only in-memory copy
         self._structure_cache = None
-        self._modules_cache = {}
+        self._modules_cache: OrderedDict[str, _CachedModule] = OrderedDict()
+        self.max_cached_modules = max_cached_modules
+        self._modules_db: Optional[sqlite3.Connection] = None
+        self._search_index: Optional[Dict[str, set]] = None
+        self._search_index_key: Optional[Tuple[int, int]] = None
+        self._search_vocabulary: Optional[Tuple[str, List[int], List[str]]] = None
+        
+        # While a bulk pass runs, newly parsed modules are held here and
+        # written to disk together when it finishes
+        self._in_bulk = False
+        self._unsaved_modules: Dict[str, Dict[str, Any]] = {}
+        
+        # Module IDs in textbook order, derived once from the structure
+        self._all_module_ids: Optional[List[str]] = None
+        self._total_module_count = 0
         
         # Load cached data if available
         self._load_caches()
@@ -51,29 +93,98 @@ class TextbookProcessor:
                 with open(self.structure_cache_file, 'rb') as f:
                     self._structure_cache = pickle.load(f)
                 print("Loaded textbook structure from cache")
-            
-            if self.modules_cache_file.exists():
-                with open(self.modules_cache_file, 'rb') as f:
-                    self._modules_cache = pickle.load(f)
-                print(f"Loaded {len(self._modules_cache)} modules from cache")
         except Exception as e:
             print(f"Error loading caches: {e}")
             self._structure_cache = None
-            self._modules_cache = {}
+        
+        # Modules are read from the database as they are requested
+        try:
+            self._modules_db = sqlite3.connect(str(self.modules_db_file),
+                                               check_same_thread=False)
+            self._modules_db.execute(
+                "CREATE TABLE IF NOT EXISTS modules (id TEXT PRIMARY KEY, data BLOB NOT NULL)"
+            )
+            stored_modules = self._count_stored_modules()
+        except sqlite3.Error as e:
+            print(f"Error opening module cache: {e}")
+            self._modules_db = None
+            return
+        
+        # Carry over modules from the older single-pickle cache
+        if stored_modules == 0 and self.legacy_modules_cache_file.exists():
+            try:
+                with open(self.legacy_modules_cache_file, 'rb') as f:
+                    self._store_modules(pickle.load(f))
+                stored_modules = self._count_stored_modules()
+            except Exception as e:
+                print(f"Error loading caches: {e}")
+        
+        print(f"Found {stored_modules} modules in cache")
     
     def _save_caches(self):
-        """Save cached data to disk"""
+        """Save the textbook structure to disk"""
         try:
             if self._structure_cache:
-                with open(self.structure_cache_file, 'wb') as f:
-                    pickle.dump(self._structure_cache, f)
-            
-            if self._modules_cache:
-                with open(self.modules_cache_file, 'wb') as f:
-                    pickle.dump(self._modules_cache, f)
+                self._write_pickle(self.structure_cache_file, self._structure_cache)
         except Exception as e:
             print(f"Error saving caches: {e}")
     
+    @staticmethod
+    def _write_pickle(path: Path, obj: Any):
+        """Pickle obj to a temporary file and move it over path in one step"""
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # A crash mid-write leaves the previous cache file intact
+        os.replace(tmp_path, path)
+    
+    def _load_stored_module(self, module_id: str) -> Optional[Dict[str, Any]]:
+        """Read one module dictionary from the on-disk module cache"""
+        if self._modules_db is None:
+            return None
+        
+        try:
+            row = self._modules_db.execute(
+                "SELECT data FROM modules WHERE id = ?", (module_id,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading module {module_id} from cache: {e}")
+            return None
+        
+        return pickle.loads(row[0]) if row else None
+    
+    def _store_modules(self, modules: Dict[str, Dict[str, Any]]):
+        """Write module dictionaries to the on-disk module cache in one transaction"""
+        if self._modules_db is None or not modules:
+            return
+        
+        rows = [(module_id, pickle.dumps(module_dict, protocol=pickle.HIGHEST_PROTOCOL))
+                for module_id, module_dict in modules.items()]
+        try:
+            with self._modules_db:
+                self._modules_db.executemany(
+                    "INSERT OR REPLACE INTO modules (id, data) VALUES (?, ?)", rows
+                )
+        except sqlite3.Error as e:
+            print(f"Error saving modules to cache: {e}")
+    
+    def _stored_module_ids(self) -> frozenset:
+        """IDs of the modules in the on-disk module cache"""
+        if self._modules_db is None:
+            return frozenset()
+        
+        try:
+            return frozenset(row[0] for row in self._modules_db.execute("SELECT id FROM modules"))
+        except sqlite3.Error as e:
+            print(f"Error reading module cache: {e}")
+            return frozenset()
+    
+    def _count_stored_modules(self) -> int:
+        """Number of modules in the on-disk module cache"""
+        if self._modules_db is None:
+            return len(self._modules_cache)
+        return self._modules_db.execute("SELECT COUNT(*) FROM modules").fetchone()[0]
+    
     def get_textbook_structure(self) -> Dict[str, Any]:
         """
         Get the hierarchical structure of the textbook.
@@ -94,85 +205,195 @@ class TextbookProcessor:
             self._save_caches()
             print("Textbook structure parsed and cached")
         
+        if self._all_module_ids is None:
+            # Walk chapters and their nested sections with an explicit stack,
+            # pushing children reversed so modules keep their reading order
+            module_ids = []
+            stack = list(reversed(self._structure_cache['chapters']))
+            while stack:
+                node = stack.pop()
+                module_ids.extend(node.get('modules', []))
+                stack.extend(reversed(node.get('sections', [])))
+            self._all_module_ids = module_ids
+            self._total_module_count = len(module_ids)
+        
         return self._structure_cache
     
-    def get_module_content(self, module_id: str) -> Optional[Dict[str, Any]]:
+    def get_module_content(self, module_id: str, bulk: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get the content of a specific module.
         
         Args:
             module_id: The module ID (e.g., 'm66426')
+            bulk: Skip caching the parsed module, for one-off passes over
+                  many modules that would otherwise fill the cache
             
         Returns:
             Dictionary containing module content and metadata
         """
-        # Check cache first
-        if module_id in self._modules_cache:
-            return self._modules_cache[module_id]
+        # Check the in-memory cache, then the on-disk one
+        cached = self._cached_module(module_id)
+        if cached is not None:
+            return cached.content
+        
+        module_dict = self._load_stored_module(module_id)
+        if module_dict is None:
+            module_dict = self._parse_module_dict(module_id)
+            if module_dict is None:
+                return None
+            if self._in_bulk:
+                self._unsaved_modules[module_id] = module_dict
+            else:
+                self._store_modules({module_id: module_dict})
+        
+        # Cache the result
+        if not bulk:
+            self._cache_module(module_id, module_dict)
         
-        # Parse the module
+        return module_dict
+    
+    def _cached_module(self, module_id: str) -> Optional['_CachedModule']:
+        """Look a module up in memory, marking it as the most recently used"""
+        cached = self._modules_cache.get(module_id)
+        if cached is not None:
+            self._modules_cache.move_to_end(module_id)
+        return cached
+    
+    def _cache_module(self, module_id: str, module_dict: Dict[str, Any]) -> '_CachedModule':
+        """Hold a module in memory, evicting the least recently used one"""
+        cached = _CachedModule(module_dict)
+        self._modules_cache[module_id] = cached
+        if len(self._modules_cache) > self.max_cached_modules:
+            self._modules_cache.popitem(last=False)
+        return cached
+    
+    def get_module_json(self, module_id: str) -> Optional[bytes]:
+        """
+        Get the content of a specific module serialized as JSON.
+        
+        A cached module is serialized once and the bytes are kept alongside
+        its dictionary, so the API can return them without re-encoding the
+        dictionary per request.
+        
+        Args:
+            module_id: The module ID (e.g., 'm66426')
+            
+        Returns:
+            UTF-8 JSON bytes of the module dictionary
+        """
+        cached = self._cached_module(module_id)
+        if cached is None:
+            module_content = self.get_module_content(module_id, bulk=True)
+            if module_content is None:
+                return None
+            cached = self._cache_module(module_id, module_content)
+        
+        if cached.json is None:
+            cached.json = self._dump_json(cached.content)
+        return cached.json
+    
+    @staticmethod
+    def _dump_json(data: Any) -> bytes:
+        """Serialize data to compact UTF-8 JSON bytes"""
+        if HAS_ORJSON:
+            return orjson.dumps(data)
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
+    def _parse_module_dict(self, module_id: str) -> Optional[Dict[str, Any]]:
+        """Parse a module into its JSON-serializable dictionary form"""
         print(f"Parsing module {module_id}...")
-        module_content = self.parser.parse_module(module_id)
+        module_content = self.parser.parse_module(module_id, cache=False)
         
         if module_content is None:
             return None
         
-        # Convert to dictionary for JSON serialization
-        module_dict = {
-            'id': module_content.id,
-            'title': module_content.title,
-            'content': module_content.content,
-            'figures': module_content.figures,
-            'learning_objectives': module_content.learning_objectives,
-            'key_terms': module_content.key_terms,
-            'metadata': module_content.metadata
-        }
+        return _module_to_dict(module_content)
+    
+    def _parse_modules_parallel(self, module_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Parse the modules that are not cached anywhere across CPU cores.
         
-        # Cache the result
-        self._modules_cache[module_id] = module_dict
-        self._save_caches()
+        The parser's process pool does the parsing; the parsed modules are
+        written to the on-disk cache in one batch.
         
-        return module_dict
+        Args:
+            module_ids: The module IDs that will be needed
+            
+        Returns:
+            Module dictionary (or None on failure) for each module parsed
+        """
+        stored_ids = self._stored_module_ids()
+        pending = [mid for mid in dict.fromkeys(module_ids)
+                   if mid not in self._modules_cache and mid not in stored_ids]
+        if not pending:
+            return {}
+        
+        print(f"Parsing {len(pending)} modules...")
+        workers = min(os.cpu_count() or 1, len(pending))
+        results = self.parser.parse_modules_parallel(pending, max_workers=workers, cache=False)
+        parsed = {mid: _module_to_dict(module_content) if module_content is not None else None
+                  for mid, module_content in zip(pending, results)}
+        
+        self._store_modules({mid: module_dict for mid, module_dict in parsed.items()
+                             if module_dict is not None})
+        return parsed
     
-    def get_all_modules(self) -> List[Dict[str, Any]]:
+    def warm_cache(self) -> int:
         """
-        Get all modules in the textbook.
+        Make sure every module is on disk and preload the in-memory cache.
         
-        This method extracts all module IDs from the textbook structure
-        and returns their content. Useful for bulk processing.
+        Modules already on disk are loaded rather than parsed; the rest are
+        parsed across CPU cores and written to disk in one batch. The first
+        modules in textbook order, up to max_cached_modules, are then held
+        in memory with their JSON serialized up front.
         
         Returns:
-            List of all module dictionaries
+            Number of modules held in the cache
         """
-        structure = self.get_textbook_structure()
-        all_modules = []
+        self.get_textbook_structure()
+        module_ids = self._all_module_ids
+        parsed = self._parse_modules_parallel(module_ids)
         
-        def extract_module_ids(chapters):
-            """Recursively extract module IDs from the structure"""
-            module_ids = []
-            for chapter in chapters:
-                # Add modules directly in the chapter
-                module_ids.extend(chapter.get('modules', []))
-                
-                # Add modules from sections
-                for section in chapter.get('sections', []):
-                    module_ids.extend(section.get('modules', []))
-                    
-                    # Handle nested sections if they exist
-                    if 'sections' in section:
-                        module_ids.extend(extract_module_ids([section]))
+        for module_id in module_ids[:self.max_cached_modules]:
+            if module_id in self._modules_cache:
+                continue
             
-            return module_ids
+            if module_id in parsed:
+                module_dict = parsed[module_id]
+            else:
+                module_dict = self._load_stored_module(module_id)
+            
+            if module_dict is not None:
+                cached = self._cache_module(module_id, module_dict)
+                cached.json = self._dump_json(module_dict)
         
-        module_ids = extract_module_ids(structure['chapters'])
+        return len(self._modules_cache)
+    
+    def get_all_modules(self) -> Iterator[Dict[str, Any]]:
+        """
+        Get all modules in the textbook.
+        
+        This method extracts all module IDs from the textbook structure
+        and yields their content one module at a time. Useful for bulk
+        processing: modules not cached on disk are parsed up front across
+        CPU cores and released as they are yielded, and none are kept in
+        the in-memory cache or the parser's memo.
+        
+        Yields:
+            Each module dictionary, in textbook order
+        """
+        self.get_textbook_structure()
+        module_ids = self._all_module_ids
+        parsed = self._parse_modules_parallel(module_ids)
         
         # Get content for each module
         for module_id in module_ids:
-            module_content = self.get_module_content(module_id)
+            if module_id in parsed:
+                module_content = parsed.pop(module_id)
+            else:
+                module_content = self.get_module_content(module_id, bulk=True)
             if module_content:
-                all_modules.append(module_content)
-        
-        return all_modules
+                yield module_content
     
     def search_modules(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -190,27 +411,144 @@ class TextbookProcessor:
         query_lower = query.lower()
         matching_modules = []
         
-        structure = self.get_textbook_structure()
+        self.get_textbook_structure()
+        module_ids = self._all_module_ids
+        
+        # Any match contains each word of the query inside a word of the
+        # module, so only modules indexed under such words need checking
+        query_words = list(_WORD_RE.finditer(query_lower))
+        if query_words:
+            index = self._get_search_index()
+            candidates = None
+            for match in query_words:
+                word_matches = set()
+                for word in self._matching_index_words(match.group(), match.start() > 0,
+                                                       match.end() < len(query_lower)):
+                    word_matches |= index[word]
+                candidates = word_matches if candidates is None else candidates & word_matches
+                if not candidates:
+                    return []
+            module_ids = [mid for mid in module_ids if mid in candidates]
+        
+        self._in_bulk = True
+        try:
+            for module_id in module_ids:
+                module_content = self.get_module_content(module_id)
+                if module_content:
+                    # Search in title and content
+                    if (query_lower in module_content['title'].lower() or 
+                        query_lower in module_content['content'].lower()):
+                        matching_modules.append(module_content)
+        finally:
+            self._in_bulk = False
+            self._store_modules(self._unsaved_modules)
+            self._unsaved_modules = {}
         
-        def extract_module_ids(chapters):
-            module_ids = []
-            for chapter in chapters:
-                module_ids.extend(chapter.get('modules', []))
-                for section in chapter.get('sections', []):
-                    module_ids.extend(section.get('modules', []))
-            return module_ids
+        return matching_modules
+    
+    def _get_search_index(self) -> Dict[str, set]:
+        """
+        Get the inverted index of words to the IDs of modules containing them.
         
-        module_ids = extract_module_ids(structure['chapters'])
+        The index covers module titles and content, lowercased. It is built
+        from all modules and cached on disk together with the state of the
+        module cache it was built from, and rebuilt once that changes.
+        """
+        key = self._stored_modules_key()
+        if self._search_index is not None and self._search_index_key == key:
+            return self._search_index
+        
+        index = None
+        if key is not None and self.search_index_file.exists():
+            try:
+                with open(self.search_index_file, 'rb') as f:
+                    cached = pickle.load(f)
+                if cached.get('key') == key:
+                    index = cached['index']
+            except Exception as e:
+                print(f"Error loading search index: {e}")
+        
+        if index is None:
+            print("Building search index...")
+            index = {}
+            for module_content in self.get_all_modules():
+                text = f"{module_content['title']} {module_content['content']}".lower()
+                for word in set(_WORD_RE.findall(text)):
+                    index.setdefault(word, set()).add(module_content['id'])
+            
+            # Building may have parsed and stored modules
+            key = self._stored_modules_key()
+            if key is not None:
+                try:
+                    self._write_pickle(self.search_index_file, {'key': key, 'index': index})
+                except Exception as e:
+                    print(f"Error saving search index: {e}")
+        
+        self._search_index = index
+        self._search_index_key = key
+        self._search_vocabulary = None
+        return index
+    
+    def _stored_modules_key(self) -> Optional[Tuple[int, int]]:
+        """Identify the on-disk module cache's contents; changes whenever a module is stored"""
+        if self._modules_db is None:
+            return None
         
-        for module_id in module_ids:
-            module_content = self.get_module_content(module_id)
-            if module_content:
-                # Search in title and content
-                if (query_lower in module_content['title'].lower() or 
-                    query_lower in module_content['content'].lower()):
-                    matching_modules.append(module_content)
+        try:
+            count, last_row = self._modules_db.execute(
+                "SELECT COUNT(*), MAX(rowid) FROM modules"
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading module cache: {e}")
+            return None
+        return count, last_row or 0
+    
+    def _matching_index_words(self, query_word: str, starts_word: bool,
+                              ends_word: bool) -> List[str]:
+        """
+        Find the index words a query word can fall within.
         
-        return matching_modules
+        Args:
+            query_word: A word of the lowercased query
+            starts_word: The query has a non-word character before it, so it
+                         must begin a word of the module
+            ends_word: The query has a non-word character after it, so it
+                       must end a word of the module
+            
+        Returns:
+            Index words that may contain the query word at that position
+        """
+        index = self._search_index
+        if starts_word and ends_word:
+            return [query_word] if query_word in index else []
+        
+        # Search every index word at once in a newline-joined vocabulary,
+        # mapping each hit back to its word by offset
+        if self._search_vocabulary is None:
+            words = list(index)
+            offsets = []
+            position = 0
+            for word in words:
+                offsets.append(position)
+                position += len(word) + 1
+            self._search_vocabulary = ('\n'.join(words), offsets, words)
+        vocabulary, offsets, words = self._search_vocabulary
+        
+        matches = []
+        position = vocabulary.find(query_word)
+        while position != -1:
+            i = bisect_right(offsets, position) - 1
+            word = words[i]
+            if ((not starts_word or word.startswith(query_word)) and
+                    (not ends_word or word.endswith(query_word))):
+                matches.append(word)
+            
+            # Continue from the next word; each word is listed once
+            if i + 1 == len(words):
+                break
+            position = vocabulary.find(query_word, offsets[i + 1])
+        
+        return matches
     
     def get_module_chunks(self, module_id: str, chunk_size: int = 500) -> List[Dict[str, Any]]:
         """
@@ -233,40 +571,37 @@ class TextbookProcessor:
         content = module_content['content']
         chunks = []
         
-        # Simple chunking by paragraphs and sentences
-        # This could be improved with more sophisticated chunking strategies
-        sentences = content.split('. ')
+        # Attribution shared by every chunk of this module
+        base = {
+            'module_id': module_id,
+            'module_title': module_content['title'],
+            'metadata': module_content['metadata']
+        }
         
-        current_chunk = ""
+        # Simple chunking by sentences: walk sentence end offsets (the end of
+        # the text closes the last one) and only slice the content once a
+        # chunk is finalized
+        # This could be improved with more sophisticated chunking strategies
+        sentence_ends = chain((match.end() for match in _SENTENCE_END_RE.finditer(content)),
+                              (len(content),))
+        chunk_start = 0
+        chunk_end = 0
         chunk_index = 0
         
-        for sentence in sentences:
-            # Add sentence to current chunk
-            potential_chunk = current_chunk + sentence + ". "
-            
+        for sentence_end in sentence_ends:
             # If chunk is getting too long, finalize it
-            if len(potential_chunk) > chunk_size and current_chunk:
-                chunks.append({
-                    'text': current_chunk.strip(),
-                    'module_id': module_id,
-                    'module_title': module_content['title'],
-                    'chunk_index': chunk_index,
-                    'metadata': module_content['metadata']
-                })
-                current_chunk = sentence + ". "
-                chunk_index += 1
-            else:
-                current_chunk = potential_chunk
+            if sentence_end - chunk_start > chunk_size and chunk_end > chunk_start:
+                text = content[chunk_start:chunk_end].strip()
+                if text:
+                    chunks.append({**base, 'text': text, 'chunk_index': chunk_index})
+                    chunk_index += 1
+                chunk_start = chunk_end
+            chunk_end = sentence_end
         
         # Add the last chunk if it has content
-        if current_chunk.strip():
-            chunks.append({
-                'text': current_chunk.strip(),
-                'module_id': module_id,
-                'module_title': module_content['title'],
-                'chunk_index': chunk_index,
-                'metadata': module_content['metadata']
-            })
+        text = content[chunk_start:chunk_end].strip()
+        if text:
+            chunks.append({**base, 'text': text, 'chunk_index': chunk_index})
         
         return chunks
     
@@ -278,21 +613,34 @@ class TextbookProcessor:
             Dictionary with content statistics
         """
         structure = self.get_textbook_structure()
-        
-        def count_modules(chapters):
-            count = 0
-            for chapter in chapters:
-                count += len(chapter.get('modules', []))
-                for section in chapter.get('sections', []):
-                    count += len(section.get('modules', []))
-            return count
-        
-        total_modules = count_modules(structure['chapters'])
-        cached_modules = len(self._modules_cache)
+        total_modules = self._total_module_count
+        cached_modules = self._count_stored_modules()
         
         return {
             'total_chapters': len(structure['chapters']),
             'total_modules': total_modules,
             'cached_modules': cached_modules,
             'cache_hit_rate': cached_modules / total_modules if total_modules > 0 else 0
-        }
\ No newline at end of file
+        }
+
+
+def _module_to_dict(module_content: ModuleContent) -> Dict[str, Any]:
+    """Convert parsed module content to a dictionary for JSON serialization"""
+    # Containers are copied (asdict copies the figures) so changing the
+    # dictionary never alters a ModuleContent the parser has memoized
+    return {
+        'id': module_content.id,
+        'title': module_content.title,
+        'content': module_content.content,
+        'figures': [asdict(figure) for figure in module_content.figures],
+        'learning_objectives': list(module_content.learning_objectives),
+        'key_terms': list(module_content.key_terms),
+        'metadata': dict(module_content.metadata)
+    }
+
+
+@dataclass(slots=True)
+class _CachedModule:
+    """A module held in memory, with its JSON once serialized"""
+    content: Dict[str, Any]
+    json: Optional[bytes] = None